@@ -296,6 +296,8 @@ static AUDIT_REGISTRY_HASH: OnceLock<String> = OnceLock::new();
 static WCAG20AA_REGISTRY_HASH: OnceLock<String> = OnceLock::new();
 static SECTION508_HTML_REGISTRY_HASH: OnceLock<String> = OnceLock::new();
 static CONTRACT_FINGERPRINT: OnceLock<String> = OnceLock::new();
+static CONTRACT_FINGERPRINT_TAGGED: OnceLock<String> = OnceLock::new();
+static METADATA: OnceLock<AuditContractMetadata> = OnceLock::new();
 static AUDIT_REGISTRY_JSON_VALUE: OnceLock<Value> = OnceLock::new();
 static WCAG20AA_REGISTRY_JSON_VALUE: OnceLock<Value> = OnceLock::new();
 static SECTION508_HTML_REGISTRY_JSON_VALUE: OnceLock<Value> = OnceLock::new();
@@ -399,6 +401,13 @@ pub fn contract_fingerprint_sha256() -> String {
         .clone()
 }
 
+/// `sha256:`-prefixed contract fingerprint as embedded in verifier/PMR reports.
+pub fn contract_fingerprint_tagged() -> &'static str {
+    CONTRACT_FINGERPRINT_TAGGED
+        .get_or_init(|| format!("sha256:{}", contract_fingerprint_sha256()))
+        .as_str()
+}
+
 pub fn registry_json(name: &str) -> Option<&'static str> {
     match name {
         AUDIT_REGISTRY_ID => Some(AUDIT_REGISTRY_V1_JSON),
@@ -839,8 +848,8 @@ pub fn a11y_effective_gate_level(profile: &str, rule_id: &str) -> String {
     a11y_profile_gate_override(profile, rule_id).unwrap_or_else(|| a11y_default_gate_level(rule_id))
 }
 
-pub fn metadata() -> AuditContractMetadata {
-    AuditContractMetadata {
+pub fn metadata() -> &'static AuditContractMetadata {
+    METADATA.get_or_init(|| AuditContractMetadata {
         contract_id: CONTRACT_ID,
         contract_version: CONTRACT_VERSION,
         contract_fingerprint_sha256: contract_fingerprint_sha256(),
@@ -850,7 +859,7 @@ pub fn metadata() -> AuditContractMetadata {
         wcag20aa_registry_hash_sha256: wcag20aa_registry_v1_hash_sha256(),
         section508_html_registry_id: SECTION508_HTML_REGISTRY_ID,
         section508_html_registry_hash_sha256: section508_html_registry_v1_hash_sha256(),
-    }
+    })
 }
 
 #[cfg(test)]
@@ -869,6 +878,8 @@ mod tests {
         let b = contract_fingerprint_sha256();
         assert_eq!(a, b);
         assert_eq!(a.len(), 64);
+        assert_eq!(contract_fingerprint_tagged(), format!("sha256:{a}"));
+        assert!(std::ptr::eq(metadata(), metadata()));
     }
 
     #[test]
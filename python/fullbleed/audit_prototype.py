@@ -24,7 +24,7 @@ def _specs() -> Path:
 
 
 def _j(path: str | Path) -> dict[str, Any]:
-    return json.loads(Path(path).read_text(encoding="utf-8"))
+    return json.loads(Path(path).read_bytes())
 
 
 def _j_opt(path: str | Path | None) -> dict[str, Any] | None:
@@ -54,7 +54,7 @@ def load_section508_html_registry() -> dict[str, Any]:
     text = _runtime_registry_json_from_engine("section508_html_registry.v1")
     if text:
         return json.loads(text)
-    return json.loads(_section508_registry_path().read_text(encoding="utf-8"))
+    return json.loads(_section508_registry_path().read_bytes())
 
 
 def _worst_verdict(verdicts: list[str]) -> str | None:
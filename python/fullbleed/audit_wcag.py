@@ -53,7 +53,7 @@ def load_wcag20aa_registry() -> dict[str, Any]:
     if text:
         return json.loads(text)
     path = _wcag_registry_path()
-    return json.loads(path.read_text(encoding="utf-8"))
+    return json.loads(path.read_bytes())
 
 
 def _worst_verdict(verdicts: list[str]) -> str | None:
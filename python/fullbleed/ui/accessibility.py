@@ -172,22 +172,25 @@ def _walk_elements(node_or_document: Any) -> tuple[list[tuple[Element, str]], di
         root = node_or_document.root
     nodes: list[tuple[Element, str]] = []
 
-    def visit(node: Any, path: str) -> None:
+    # Explicit pre-order stack: no per-node frame cost and no recursion limit on deep trees.
+    stack: list[tuple[Any, str]] = []
+    if isinstance(root, Element):
+        stack.append((root, f"/{_normalize_tag(root.tag)}[1]"))
+    elif isinstance(root, (list, tuple)):
+        stack.append((root, "/fragment"))
+    while stack:
+        node, path = stack.pop()
         if isinstance(node, Element):
             nodes.append((node, path))
+            children: list[tuple[Any, str]] = []
             idx = 0
             for child in node.children:
                 if isinstance(child, Element):
                     idx += 1
-                    visit(child, f"{path}/{_normalize_tag(child.tag)}[{idx}]")
+                    children.append((child, f"{path}/{_normalize_tag(child.tag)}[{idx}]"))
+            stack.extend(reversed(children))
         elif isinstance(node, (list, tuple)):
-            for item in node:
-                visit(item, path)
-
-    if isinstance(root, Element):
-        visit(root, f"/{_normalize_tag(root.tag)}[1]")
-    elif isinstance(root, (list, tuple)):
-        visit(root, "/fragment")
+            stack.extend((item, path) for item in reversed(node))
     return nodes, meta
 
 
@@ -118,20 +118,29 @@ class CavKitBase:
 @dataclass(frozen=True)
 class CavProfileRegistry:
     profiles: tuple[CavProfile, ...]
+    _by_id: dict[str, CavProfile] = field(init=False, repr=False, compare=False)
+    _by_family: dict[str, tuple[str, ...]] = field(init=False, repr=False, compare=False)
 
-    def by_id(self, profile_id: str) -> CavProfile:
+    def __post_init__(self) -> None:
+        by_id: dict[str, CavProfile] = {}
+        by_family: dict[str, list[str]] = {}
         for profile in self.profiles:
-            if profile.profile_id == profile_id:
-                return profile
-        raise KeyError(profile_id)
+            # First registration wins, matching the previous linear-scan lookup.
+            by_id.setdefault(profile.profile_id, profile)
+            by_family.setdefault(profile.family_id, []).append(profile.profile_id)
+        object.__setattr__(self, "_by_id", by_id)
+        object.__setattr__(self, "_by_family", {k: tuple(v) for k, v in by_family.items()})
+
+    def by_id(self, profile_id: str) -> CavProfile:
+        try:
+            return self._by_id[profile_id]
+        except KeyError:
+            raise KeyError(profile_id) from None
 
     def list_ids(self, *, family_id: str | None = None) -> list[str]:
-        ids = []
-        for profile in self.profiles:
-            if family_id and profile.family_id != family_id:
-                continue
-            ids.append(profile.profile_id)
-        return ids
+        if not family_id:
+            return [profile.profile_id for profile in self.profiles]
+        return list(self._by_family.get(family_id, ()))
 
 
 def profile_registry(*profiles: CavProfile) -> CavProfileRegistry:
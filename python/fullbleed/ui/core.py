@@ -252,13 +252,22 @@ def _render_attr_value(attr: str, value: Any) -> str | None:
 
 
 def render_node(node: Any) -> str:
+    out: list[str] = []
+    _render_into(node, out)
+    return "".join(out)
+
+
+def _render_into(node: Any, out: list[str]) -> None:
+    # Append fragments to one buffer so each subtree is joined once, not once per ancestor.
     if node is None:
-        return ""
+        return
     if isinstance(node, Element):
-        attrs = _render_attrs(node.props)
-        children_html = "".join(render_node(child) for child in node.children)
-        return f"<{node.tag}{attrs}>{children_html}</{node.tag}>"
-    return escape(str(node))
+        out.append(f"<{node.tag}{_render_attrs(node.props)}>")
+        for child in node.children:
+            _render_into(child, out)
+        out.append(f"</{node.tag}>")
+        return
+    out.append(escape(str(node)))
 
 
 def Document(
@@ -1234,17 +1234,23 @@ fn merge_background_commands(base: &mut Document, background: &Document) {
 }
 
 fn escape_html_text(input: &str) -> String {
-    let mut out = String::with_capacity(input.len());
-    for ch in input.chars() {
-        match ch {
-            '&' => out.push_str("&amp;"),
-            '<' => out.push_str("&lt;"),
-            '>' => out.push_str("&gt;"),
-            '"' => out.push_str("&quot;"),
-            '\'' => out.push_str("&#39;"),
-            _ => out.push(ch),
-        }
+    // Escapable characters are all ASCII, so scan bytes and copy clean runs as slices.
+    let mut out = String::with_capacity(input.len() + input.len() / 8);
+    let mut last = 0;
+    for (idx, byte) in input.bytes().enumerate() {
+        let entity = match byte {
+            b'&' => "&amp;",
+            b'<' => "&lt;",
+            b'>' => "&gt;",
+            b'"' => "&quot;",
+            b'\'' => "&#39;",
+            _ => continue,
+        };
+        out.push_str(&input[last..idx]);
+        out.push_str(entity);
+        last = idx + 1;
     }
+    out.push_str(&input[last..]);
     out
 }
 
@@ -7819,4 +7825,25 @@ mod tests {
             "render_finalized_pdf_image_pages should be byte deterministic for identical input"
         );
     }
+
+    #[test]
+    fn escape_html_text_escapes_all_special_characters() {
+        assert_eq!(
+            escape_html_text(r#"a&b<c>d"e'f"#),
+            "a&amp;b&lt;c&gt;d&quot;e&#39;f"
+        );
+        assert_eq!(escape_html_text("&<>\"'"), "&amp;&lt;&gt;&quot;&#39;");
+        assert_eq!(escape_html_text(""), "");
+        assert_eq!(escape_html_text("plain text"), "plain text");
+    }
+
+    #[test]
+    fn escape_html_text_preserves_multibyte_utf8() {
+        assert_eq!(
+            escape_html_text("caf\u{e9} \u{2013} \u{65e5}\u{672c} \u{1f389} <b>"),
+            "caf\u{e9} \u{2013} \u{65e5}\u{672c} \u{1f389} &lt;b&gt;"
+        );
+        assert_eq!(escape_html_text("\u{e9}&\u{e9}"), "\u{e9}&amp;\u{e9}");
+        assert_eq!(escape_html_text("\u{1f389}\"\u{1f389}'"), "\u{1f389}&quot;\u{1f389}&#39;");
+    }
 }
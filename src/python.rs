@@ -917,7 +917,7 @@ fn verify_pdf_ua_seed(py: Python<'_>, pdf_path: &str, mode: &str) -> PyResult<Py
     tooling.set_item("audit_contract_version", meta.contract_version)?;
     tooling.set_item(
         "audit_contract_fingerprint",
-        meta.contract_fingerprint_sha256,
+        meta.contract_fingerprint_sha256.as_str(),
     )?;
     out.set_item("tooling", tooling)?;
     Ok(out.to_object(py))
@@ -4084,17 +4084,38 @@ fn sha256_file_hex(path: &str) -> PyResult<String> {
     Ok(out)
 }
 
+fn write_artifact_file(path: &str, bytes: &[u8]) -> std::io::Result<()> {
+    if let Some(parent) = Path::new(path).parent() {
+        if !parent.as_os_str().is_empty() {
+            std::fs::create_dir_all(parent)?;
+        }
+    }
+    std::fs::write(path, bytes)
+}
+
 fn write_hash_file(path: &str, hash: &str) -> PyResult<()> {
     std::fs::write(path, hash)
         .map_err(|e| PyValueError::new_err(format!("failed to write deterministic hash file: {e}")))
 }
 
 fn html_escape_attr(raw: &str) -> String {
-    raw.replace('&', "&amp;")
-        .replace('"', "&quot;")
-        .replace('<', "&lt;")
-        .replace('>', "&gt;")
-        .replace('\'', "&#x27;")
+    let mut out = String::with_capacity(raw.len() + raw.len() / 8);
+    let mut last = 0;
+    for (idx, byte) in raw.bytes().enumerate() {
+        let entity = match byte {
+            b'&' => "&amp;",
+            b'"' => "&quot;",
+            b'<' => "&lt;",
+            b'>' => "&gt;",
+            b'\'' => "&#x27;",
+            _ => continue,
+        };
+        out.push_str(&raw[last..idx]);
+        out.push_str(entity);
+        last = idx + 1;
+    }
+    out.push_str(&raw[last..]);
+    out
 }
 
 fn inject_css_link(
@@ -4291,7 +4312,7 @@ fn audit_contract_metadata(py: Python<'_>) -> PyResult<PyObject> {
     out.set_item("contract_version", meta.contract_version)?;
     out.set_item(
         "contract_fingerprint",
-        format!("sha256:{}", meta.contract_fingerprint_sha256),
+        audit_contract::contract_fingerprint_tagged(),
     )?;
     let registries = PyList::empty_bound(py);
 
@@ -8617,7 +8638,7 @@ fn build_a11y_verify_report_py(
     tooling.set_item("audit_contract_version", contract_meta.contract_version)?;
     tooling.set_item(
         "audit_contract_fingerprint",
-        format!("sha256:{}", contract_meta.contract_fingerprint_sha256),
+        audit_contract::contract_fingerprint_tagged(),
     )?;
     tooling.set_item(
         "audit_registry_hash",
@@ -9047,7 +9068,7 @@ fn build_pmr_report_py(
     tooling.set_item("audit_contract_version", contract_meta.contract_version)?;
     tooling.set_item(
         "audit_contract_fingerprint",
-        format!("sha256:{}", contract_meta.contract_fingerprint_sha256),
+        audit_contract::contract_fingerprint_tagged(),
     )?;
     tooling.set_item(
         "audit_registry_hash",
@@ -9683,6 +9704,61 @@ impl PdfEngine {
         Ok(out.to_object(py))
     }
 
+    #[pyo3(signature = (items, wrap_document=true))]
+    fn emit_artifacts_many(
+        &self,
+        py: Python<'_>,
+        items: Vec<(String, String, String, String)>,
+        wrap_document: bool,
+    ) -> PyResult<PyObject> {
+        // Compose every (html, css) buffer up front, write all files with the GIL released,
+        // then build the result dicts.
+        let css_media = self.normalized_css_media();
+        let mut composed = Vec::with_capacity(items.len());
+        for (html, css, html_path, css_path) in &items {
+            let html_text = if wrap_document {
+                self.engine.compose_document_html(html)
+            } else {
+                html.clone()
+            };
+            let css_text = self.engine.compose_artifact_css(css);
+            let css_href = self.effective_css_href_for_path(css_path);
+            self.ensure_css_required(css_href.as_deref())?;
+            let (patched, injected, preexisting) =
+                inject_css_link(&html_text, css_href.as_deref(), css_media.as_deref());
+            let html_effective = if injected { patched } else { html_text };
+            composed.push((html_effective, css_text, css_href, injected, preexisting));
+        }
+        py.allow_threads(|| -> std::io::Result<()> {
+            for ((html_path, css_path), (html_text, css_text, ..)) in items
+                .iter()
+                .map(|(_, _, html_path, css_path)| (html_path, css_path))
+                .zip(&composed)
+            {
+                write_artifact_file(html_path, html_text.as_bytes())?;
+                write_artifact_file(css_path, css_text.as_bytes())?;
+            }
+            Ok(())
+        })
+        .map_err(|e| to_py_err(FullBleedError::Io(e)))?;
+        let out = PyList::empty_bound(py);
+        for ((_, _, html_path, css_path), (html_text, css_text, css_href, injected, preexisting)) in
+            items.into_iter().zip(composed)
+        {
+            let entry = PyDict::new_bound(py);
+            entry.set_item("html_path", html_path)?;
+            entry.set_item("css_path", css_path)?;
+            entry.set_item("html", html_text)?;
+            entry.set_item("css", css_text)?;
+            entry.set_item("css_link_href", css_href)?;
+            entry.set_item("css_link_media", css_media.as_deref())?;
+            entry.set_item("css_link_injected", injected)?;
+            entry.set_item("css_link_preexisting", preexisting)?;
+            out.append(entry)?;
+        }
+        Ok(out.to_object(py))
+    }
+
     #[pyo3(signature = (html, css="", profile="strict", mode="error", render_preview_png_path=None, a11y_report=None, claim_evidence=None, pagination_trace_summary=None, diagnostic_signals=None))]
     fn verify_accessibility_html(
         &self,
@@ -9912,9 +9988,10 @@ impl PdfEngine {
             html_artifact_bytes: Some(html.len() as u64),
             css_artifact_bytes: Some(css.len() as u64),
         };
-        let core = self
-            .engine
-            .verify_paged_media_rank_html_core(&html, profile, mode, &ctx);
+        let core = py.allow_threads(|| {
+            self.engine
+                .verify_paged_media_rank_html_core(&html, profile, mode, &ctx)
+        });
         build_pmr_report_py(
             py,
             &core,
@@ -10494,6 +10571,10 @@ fn _fullbleed(_py: Python<'_>, module: &Bound<'_, PyModule>) -> PyResult<()> {
     module.add_function(wrap_pyfunction!(fetch_asset, module)?)?;
     module.add_function(wrap_pyfunction!(concat_css, module)?)?;
     module.add_function(wrap_pyfunction!(audit_contract_metadata, module)?)?;
+    module.add(
+        "AUDIT_CONTRACT_FINGERPRINT",
+        audit_contract::contract_fingerprint_tagged(),
+    )?;
     module.add_function(wrap_pyfunction!(audit_contract_registry, module)?)?;
     module.add_function(wrap_pyfunction!(audit_contract_wcag20aa_coverage, module)?)?;
     module.add_function(wrap_pyfunction!(
@@ -10533,3 +10614,29 @@ fn pdf_asset_inspect_err_to_py(err: crate::PdfInspectError) -> PyErr {
 fn pdf_inspect_err_to_py(err: crate::PdfInspectError) -> PyErr {
     PyValueError::new_err(format!("{}: {}", err.code.as_str(), err.message))
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn html_escape_attr_escapes_all_special_characters() {
+        assert_eq!(
+            html_escape_attr(r#"a&b<c>d"e'f"#),
+            "a&amp;b&lt;c&gt;d&quot;e&#x27;f"
+        );
+        assert_eq!(html_escape_attr("&<>\"'"), "&amp;&lt;&gt;&quot;&#x27;");
+        assert_eq!(html_escape_attr(""), "");
+        assert_eq!(html_escape_attr("styles/report.css"), "styles/report.css");
+    }
+
+    #[test]
+    fn html_escape_attr_preserves_multibyte_utf8() {
+        assert_eq!(
+            html_escape_attr("caf\u{e9} \u{2013} \u{65e5}\u{672c} \u{1f389} <b>"),
+            "caf\u{e9} \u{2013} \u{65e5}\u{672c} \u{1f389} &lt;b&gt;"
+        );
+        assert_eq!(html_escape_attr("\u{e9}&\u{e9}"), "\u{e9}&amp;\u{e9}");
+        assert_eq!(html_escape_attr("\u{1f389}\"\u{1f389}'"), "\u{1f389}&quot;\u{1f389}&#x27;");
+    }
+}
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import sys
 import types
+import warnings
 from pathlib import Path
 
+import pytest
+
 
 ROOT = Path(__file__).resolve().parents[1]
 PYTHON_SRC = ROOT / "python"
@@ -41,3 +44,68 @@ def _ensure_fullbleed_native_stub() -> None:
 
 _prefer_local_fullbleed_package()
 _ensure_fullbleed_native_stub()
+
+
+def _assert_contains_all(text, needles) -> None:
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, missing
+
+
+def _assert_contains_none(text, needles) -> None:
+    found = [needle for needle in needles if needle in text]
+    assert not found, found
+
+
+@pytest.fixture
+def assert_contains_all():
+    return _assert_contains_all
+
+
+@pytest.fixture
+def assert_contains_none():
+    return _assert_contains_none
+
+
+@pytest.fixture
+def caught_warnings():
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        yield caught
+
+
+def _reset_engine_metadata(engine) -> None:
+    engine.document_lang = "en-US"
+    engine.document_title = "t"
+    engine.document_css_href = None
+    engine.document_css_source_path = None
+    engine.document_css_media = None
+    engine.document_css_required = False
+
+
+@pytest.fixture(scope="module")
+def shared_engine():
+    import fullbleed
+
+    return fullbleed.PdfEngine(document_lang="en-US", document_title="t")
+
+
+@pytest.fixture
+def engine(shared_engine):
+    # Tests set only the metadata they need; restore defaults so the next test starts pristine.
+    yield shared_engine
+    _reset_engine_metadata(shared_engine)
+
+
+@pytest.fixture(scope="session")
+def scaffold_tree():
+    from fullbleed_cli import scaffold
+
+    cache: dict[str, dict[str, str | bytes]] = {}
+
+    def _get(relative_dir: str) -> dict[str, str | bytes]:
+        # Template trees are read-only in tests, so one walk per source_dir serves the session.
+        if relative_dir not in cache:
+            cache[relative_dir] = scaffold._load_template_tree(relative_dir)
+        return cache[relative_dir]
+
+    return _get
@@ -17,6 +17,26 @@ from fullbleed.audit_prototype import (
 ROOT = Path(__file__).resolve().parents[1]
 SPECS = ROOT / "docs" / "specs"
 
+_HTML_EMPTY_MAIN_EN_US = (
+    "<!doctype html><html lang='en-US'><head><title>X</title></head><body><main></main></body></html>"
+)
+_HTML_FOCUS_TARGETS = (
+    "<!doctype html><html lang='en-US'><head><title>X</title></head><body>"
+    "<main><a href='#x'>Link</a><input aria-label='Name'></main>"
+    "</body></html>"
+)
+_HTML_FOCUS_TARGETS_POSITIVE_TABINDEX = (
+    "<!doctype html><html lang='en-US'><head><title>X</title></head><body>"
+    "<main><a href='#x' tabindex='2'>Link</a><input aria-label='Name'></main>"
+    "</body></html>"
+)
+_CSS_EMPTY = ""
+_CSS_EMPTY_BODY = "body{}"
+_CSS_FOCUS_OUTLINE = "a:focus,input:focus{outline:2px solid #000}"
+_CSS_OUTLINE_NONE = "a,input{outline:none}"
+
+_HAS_PDF_ENGINE = hasattr(fullbleed, "PdfEngine")
+
 
 def _write(path: Path, text: str) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -24,11 +44,6 @@ def _write(path: Path, text: str) -> Path:
     return path
 
 
-def _require_pdf_engine() -> None:
-    if not hasattr(fullbleed, "PdfEngine"):
-        pytest.skip("fullbleed native extension is not available in this test environment")
-
-
 def _render_preview_png(engine: "fullbleed.PdfEngine", html: str, css: str, out_dir: Path, stem: str = "preview") -> Path:
     out_dir.mkdir(parents=True, exist_ok=True)
     if hasattr(engine, "render_image_pages_to_dir"):
@@ -157,7 +172,7 @@ def test_prototype_cav_regressions_fail_fast(tmp_path: Path) -> None:
             "</main></body></html>"
         ),
     )
-    css = _write(tmp_path / "bad.css", "body{}")
+    css = _write(tmp_path / "bad.css", _CSS_EMPTY_BODY)
     component_validation = {"overflow_count": 0, "known_loss_count": 0}
     parity_report = {"coverage": {"review_queue_items": 0}, "source_characteristics": {"page_count": 1}}
     run_report = {"metrics": {"source_page_count": 1, "render_page_count": 2}}
@@ -206,7 +221,7 @@ def test_prototype_signature_semantics_fail_is_warn_level_gate(tmp_path: Path) -
             "</body></html>"
         ),
     )
-    css = _write(tmp_path / "sig.css", "body{}")
+    css = _write(tmp_path / "sig.css", _CSS_EMPTY_BODY)
 
     verifier = prototype_verify_accessibility(
         html_path=html,
@@ -238,7 +253,7 @@ def test_prototype_reports_are_deterministic_with_fixed_timestamp(tmp_path: Path
         tmp_path / "doc.html",
         "<!doctype html><html lang='en'><head><title>X</title></head><body><main></main></body></html>",
     )
-    css = _write(tmp_path / "doc.css", "body{}")
+    css = _write(tmp_path / "doc.css", _CSS_EMPTY_BODY)
     kwargs = {
         "html_path": html,
         "css_path": css,
@@ -266,7 +281,7 @@ def test_prototype_maps_heading_label_diagnostics_and_detects_post_emit_signals(
             "</body></html>"
         ),
     )
-    css = _write(tmp_path / "doc.css", "body{}")
+    css = _write(tmp_path / "doc.css", _CSS_EMPTY_BODY)
     a11y_report = {
         "ok": False,
         "diagnostics": [
@@ -323,7 +338,7 @@ def test_prototype_detects_image_text_alternative_failures_and_title_only_warnin
             "</body></html>"
         ),
     )
-    css = _write(tmp_path / "doc.css", "body{}")
+    css = _write(tmp_path / "doc.css", _CSS_EMPTY_BODY)
     report = prototype_verify_accessibility(
         html_path=html,
         css_path=css,
@@ -360,7 +375,7 @@ def test_prototype_emits_figure_alt_budget_redundancy_and_effective_text_rules(
             "</body></html>"
         ),
     )
-    css = _write(tmp_path / "figure-rules.css", "body{}")
+    css = _write(tmp_path / "figure-rules.css", _CSS_EMPTY_BODY)
     report = prototype_verify_accessibility(
         html_path=html,
         css_path=css,
@@ -405,7 +420,7 @@ def test_prototype_emits_dl_fragmentation_and_group_consistency_rules(
             "</body></html>"
         ),
     )
-    css = _write(tmp_path / "dl-rules.css", "body{}")
+    css = _write(tmp_path / "dl-rules.css", _CSS_EMPTY_BODY)
     report = prototype_verify_accessibility(
         html_path=html,
         css_path=css,
@@ -440,7 +455,7 @@ def test_prototype_emits_redundant_aria_native_rules(tmp_path: Path) -> None:
             "</body></html>"
         ),
     )
-    css = _write(tmp_path / "aria-native-rules.css", "body{}")
+    css = _write(tmp_path / "aria-native-rules.css", _CSS_EMPTY_BODY)
     report = prototype_verify_accessibility(
         html_path=html,
         css_path=css,
@@ -471,7 +486,7 @@ def test_prototype_detects_unlabeled_form_controls(tmp_path: Path) -> None:
             "</main></body></html>"
         ),
     )
-    css = _write(tmp_path / "doc.css", "body{}")
+    css = _write(tmp_path / "doc.css", _CSS_EMPTY_BODY)
     report = prototype_verify_accessibility(
         html_path=html,
         css_path=css,
@@ -505,7 +520,7 @@ def test_prototype_detects_invalid_controls_without_error_identification(
             "</main></body></html>"
         ),
     )
-    css = _write(tmp_path / "doc.css", "body{}")
+    css = _write(tmp_path / "doc.css", _CSS_EMPTY_BODY)
     report = prototype_verify_accessibility(
         html_path=html,
         css_path=css,
@@ -537,7 +552,7 @@ def test_prototype_detects_unnamed_and_generic_link_purpose_signals(tmp_path: Pa
             "</main></body></html>"
         ),
     )
-    css = _write(tmp_path / "links.css", "body{}")
+    css = _write(tmp_path / "links.css", _CSS_EMPTY_BODY)
     report = prototype_verify_accessibility(
         html_path=html,
         css_path=css,
@@ -568,7 +583,7 @@ def test_prototype_warns_on_sensory_characteristics_instruction_phrases(
             "</main></body></html>"
         ),
     )
-    css = _write(tmp_path / "sensory.css", "body{}")
+    css = _write(tmp_path / "sensory.css", _CSS_EMPTY_BODY)
     report = prototype_verify_accessibility(
         html_path=html,
         css_path=css,
@@ -601,7 +616,7 @@ def test_prototype_flags_invalid_language_of_parts_declarations(tmp_path: Path)
             "</body></html>"
         ),
     )
-    css = _write(tmp_path / "lang-parts.css", "body{}")
+    css = _write(tmp_path / "lang-parts.css", _CSS_EMPTY_BODY)
     report = prototype_verify_accessibility(
         html_path=html,
         css_path=css,
@@ -634,7 +649,7 @@ def test_prototype_warns_on_non_interference_risk_signals(tmp_path: Path) -> Non
             "</main></body></html>"
         ),
     )
-    css = _write(tmp_path / "active.css", "body{}")
+    css = _write(tmp_path / "active.css", _CSS_EMPTY_BODY)
     report = prototype_verify_accessibility(
         html_path=html,
         css_path=css,
@@ -671,9 +686,9 @@ def test_prototype_marks_complete_processes_scope_seed_manual_for_transactional_
 ) -> None:
     html = _write(
         tmp_path / "txn.html",
-        "<!doctype html><html lang='en-US'><head><title>X</title></head><body><main></main></body></html>",
+        _HTML_EMPTY_MAIN_EN_US,
     )
-    css = _write(tmp_path / "txn.css", "body{}")
+    css = _write(tmp_path / "txn.css", _CSS_EMPTY_BODY)
     report = prototype_verify_accessibility(
         html_path=html,
         css_path=css,
@@ -699,9 +714,9 @@ def test_prototype_marks_complete_processes_scope_seed_manual_for_transactional_
 def test_prototype_emits_section508_e205_claim_seed_rules(tmp_path: Path) -> None:
     html = _write(
         tmp_path / "s508.html",
-        "<!doctype html><html lang='en-US'><head><title>X</title></head><body><main></main></body></html>",
+        _HTML_EMPTY_MAIN_EN_US,
     )
-    css = _write(tmp_path / "s508.css", "body{}")
+    css = _write(tmp_path / "s508.css", _CSS_EMPTY_BODY)
     report = prototype_verify_accessibility(
         html_path=html,
         css_path=css,
@@ -731,7 +746,7 @@ def test_prototype_claim_evidence_can_satisfy_claim_seed_rules(tmp_path: Path) -
             "</body></html>"
         ),
     )
-    css = _write(tmp_path / "claim.css", "body{}")
+    css = _write(tmp_path / "claim.css", _CSS_EMPTY_BODY)
     report = prototype_verify_accessibility(
         html_path=html,
         css_path=css,
@@ -961,19 +976,9 @@ def test_prototype_claim_evidence_can_satisfy_claim_seed_rules(tmp_path: Path) -
 
 
 def test_prototype_focus_visible_seed_uses_css_focus_and_outline_signals(tmp_path: Path) -> None:
-    html = _write(
-        tmp_path / "focus.html",
-        (
-            "<!doctype html><html lang='en-US'><head><title>X</title></head><body>"
-            "<main><a href='#x'>Link</a><input aria-label='Name'></main>"
-            "</body></html>"
-        ),
-    )
-    css_pass = _write(
-        tmp_path / "focus-pass.css",
-        "a:focus,input:focus{outline:2px solid #000}",
-    )
-    css_warn = _write(tmp_path / "focus-warn.css", "a,input{outline:none}")
+    html = _write(tmp_path / "focus.html", _HTML_FOCUS_TARGETS)
+    css_pass = _write(tmp_path / "focus-pass.css", _CSS_FOCUS_OUTLINE)
+    css_warn = _write(tmp_path / "focus-warn.css", _CSS_OUTLINE_NONE)
 
     pass_report = prototype_verify_accessibility(
         html_path=html,
@@ -1011,7 +1016,7 @@ def test_prototype_keyboard_seed_warns_on_pointer_only_custom_click_handlers(
             "</body></html>"
         ),
     )
-    css = _write(tmp_path / "keyboard.css", "")
+    css = _write(tmp_path / "keyboard.css", _CSS_EMPTY)
 
     report = prototype_verify_accessibility(
         html_path=html,
@@ -1035,23 +1040,9 @@ def test_prototype_keyboard_seed_warns_on_pointer_only_custom_click_handlers(
 def test_prototype_focus_order_seed_warns_on_positive_tabindex_and_passes_without_it(
     tmp_path: Path,
 ) -> None:
-    html_warn = _write(
-        tmp_path / "focus-order-warn.html",
-        (
-            "<!doctype html><html lang='en-US'><head><title>X</title></head><body>"
-            "<main><a href='#x' tabindex='2'>Link</a><input aria-label='Name'></main>"
-            "</body></html>"
-        ),
-    )
-    html_pass = _write(
-        tmp_path / "focus-order-pass.html",
-        (
-            "<!doctype html><html lang='en-US'><head><title>X</title></head><body>"
-            "<main><a href='#x'>Link</a><input aria-label='Name'></main>"
-            "</body></html>"
-        ),
-    )
-    css = _write(tmp_path / "focus-order.css", "body{}")
+    html_warn = _write(tmp_path / "focus-order-warn.html", _HTML_FOCUS_TARGETS_POSITIVE_TABINDEX)
+    html_pass = _write(tmp_path / "focus-order-pass.html", _HTML_FOCUS_TARGETS)
+    css = _write(tmp_path / "focus-order.css", _CSS_EMPTY_BODY)
     warn_report = prototype_verify_accessibility(
         html_path=html_warn,
         css_path=css,
@@ -1079,8 +1070,11 @@ def test_prototype_focus_order_seed_warns_on_positive_tabindex_and_passes_withou
     assert pass_row["evidence"][0]["values"]["interactive_focus_target_count"] == 2
 
 
+@pytest.mark.skipif(
+    not _HAS_PDF_ENGINE,
+    reason="fullbleed native extension is not available in this test environment",
+)
 def test_prototype_warns_on_low_render_contrast_seed(tmp_path: Path) -> None:
-    _require_pdf_engine()
     html_text = (
         "<!doctype html><html lang='en'><head><title>X</title></head><body>"
         "<main><p class='c'>Low Contrast Sample</p></main></body></html>"
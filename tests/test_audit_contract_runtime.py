@@ -18,24 +18,49 @@ ROOT = Path(__file__).resolve().parents[1]
 SPECS = ROOT / "docs" / "specs"
 
 
-def _require_contract_api() -> None:
-    if not hasattr(fullbleed, "audit_contract_metadata") or not hasattr(
-        fullbleed, "audit_contract_registry"
-    ):
-        pytest.skip("fullbleed native extension contract API is not available")
-    if not hasattr(fullbleed, "audit_contract_wcag20aa_coverage"):
-        pytest.skip("fullbleed native WCAG coverage helper is not available")
-    if not hasattr(fullbleed, "audit_contract_section508_html_coverage"):
-        pytest.skip("fullbleed native Section 508 HTML coverage helper is not available")
+_HAS_CONTRACT_API = all(
+    hasattr(fullbleed, name)
+    for name in (
+        "audit_contract_metadata",
+        "audit_contract_registry",
+        "audit_contract_wcag20aa_coverage",
+        "audit_contract_section508_html_coverage",
+    )
+)
+
+pytestmark = pytest.mark.skipif(
+    not _HAS_CONTRACT_API,
+    reason="fullbleed native extension contract API is not available",
+)
+
+
+_REGISTRY_IDS = (
+    "fullbleed.audit_registry.v1",
+    "wcag20aa_registry.v1",
+    "section508_html_registry.v1",
+)
+
 
+@pytest.fixture(scope="module")
+def contract_meta() -> dict:
+    return fullbleed.audit_contract_metadata()
 
-def _sha(text: str) -> str:
-    return "sha256:" + hashlib.sha256(text.encode("utf-8")).hexdigest()
 
+@pytest.fixture(scope="module")
+def spec_registry_bytes() -> dict[str, bytes]:
+    return {registry_id: (SPECS / f"{registry_id}.yaml").read_bytes() for registry_id in _REGISTRY_IDS}
 
-def test_audit_contract_runtime_metadata_is_stable() -> None:
-    _require_contract_api()
-    m1 = fullbleed.audit_contract_metadata()
+
+@pytest.fixture(scope="module")
+def spec_registry_hashes(spec_registry_bytes) -> dict[str, str]:
+    return {
+        registry_id: "sha256:" + hashlib.sha256(raw).hexdigest()
+        for registry_id, raw in spec_registry_bytes.items()
+    }
+
+
+def test_audit_contract_runtime_metadata_is_stable(contract_meta) -> None:
+    m1 = contract_meta
     m2 = fullbleed.audit_contract_metadata()
 
     assert m1 == m2
@@ -45,64 +70,66 @@ def test_audit_contract_runtime_metadata_is_stable() -> None:
     assert len(m1["registries"]) >= 2
 
 
-def test_audit_contract_runtime_registries_match_spec_artifacts() -> None:
-    _require_contract_api()
+def test_audit_contract_runtime_registries_match_spec_artifacts(
+    contract_meta, spec_registry_bytes, spec_registry_hashes
+) -> None:
+    reg_hashes = {row["id"]: row["hash"] for row in contract_meta["registries"]}
 
-    embedded_audit = fullbleed.audit_contract_registry("fullbleed.audit_registry.v1")
-    embedded_wcag = fullbleed.audit_contract_registry("wcag20aa_registry.v1")
-    embedded_s508 = fullbleed.audit_contract_registry("section508_html_registry.v1")
+    for registry_id in _REGISTRY_IDS:
+        embedded = fullbleed.audit_contract_registry(registry_id)
+        spec_raw = spec_registry_bytes[registry_id]
+        assert embedded == spec_raw.decode("utf-8"), registry_id
+        assert json.loads(embedded) == json.loads(spec_raw), registry_id
+        # Embedded text equals the spec file, so hashing the spec bytes matches the runtime hash.
+        assert reg_hashes[registry_id] == spec_registry_hashes[registry_id], registry_id
 
-    spec_audit = (SPECS / "fullbleed.audit_registry.v1.yaml").read_bytes().decode("utf-8")
-    spec_wcag = (SPECS / "wcag20aa_registry.v1.yaml").read_bytes().decode("utf-8")
-    spec_s508 = (SPECS / "section508_html_registry.v1.yaml").read_bytes().decode("utf-8")
+    # Contract fingerprint is a build-level aggregate, so just assert format + stability here.
+    assert isinstance(contract_meta["contract_fingerprint"], str)
+    assert contract_meta["contract_fingerprint"].startswith("sha256:")
 
-    assert embedded_audit == spec_audit
-    assert embedded_wcag == spec_wcag
-    assert embedded_s508 == spec_s508
-    assert json.loads(embedded_audit) == json.loads(spec_audit)
-    assert json.loads(embedded_wcag) == json.loads(spec_wcag)
-    assert json.loads(embedded_s508) == json.loads(spec_s508)
 
-    meta = fullbleed.audit_contract_metadata()
-    reg_hashes = {row["id"]: row["hash"] for row in meta["registries"]}
-    assert reg_hashes["fullbleed.audit_registry.v1"] == _sha(embedded_audit)
-    assert reg_hashes["wcag20aa_registry.v1"] == _sha(embedded_wcag)
-    assert reg_hashes["section508_html_registry.v1"] == _sha(embedded_s508)
+def test_audit_contract_fingerprint_constant_matches_metadata(contract_meta) -> None:
+    if not hasattr(fullbleed, "AUDIT_CONTRACT_FINGERPRINT"):
+        pytest.skip("AUDIT_CONTRACT_FINGERPRINT is not exported by this build")
 
-    # Contract fingerprint is a build-level aggregate, so just assert format + stability here.
-    assert isinstance(meta["contract_fingerprint"], str)
-    assert meta["contract_fingerprint"].startswith("sha256:")
+    assert fullbleed.AUDIT_CONTRACT_FINGERPRINT == contract_meta["contract_fingerprint"]
 
 
 def test_audit_contract_registry_unknown_name_raises() -> None:
-    _require_contract_api()
     with pytest.raises(ValueError):
         fullbleed.audit_contract_registry("unknown.registry")
 
 
-def test_audit_contract_wcag20aa_coverage_matches_python_fallback() -> None:
-    _require_contract_api()
-    findings = [
-        {"rule_id": "fb.a11y.html.lang_present_valid", "verdict": "pass"},
-        {"rule_id": "fb.a11y.html.title_present_nonempty", "verdict": "pass"},
-        {"rule_id": "fb.a11y.ids.duplicate_id", "verdict": "fail"},
-        {"rule_id": "fb.a11y.signatures.text_semantics_present", "verdict": "manual_needed"},
-        {"rule_id": "fb.a11y.aria.reference_target_exists", "verdict": "pass"},
-    ]
-    native = fullbleed.audit_contract_wcag20aa_coverage(findings)
-    py_fallback = wcag20aa_coverage_from_findings(findings, registry=load_wcag20aa_registry())
-    assert native == py_fallback
-
-
-def test_audit_contract_section508_html_coverage_matches_python_fallback() -> None:
-    _require_contract_api()
-    findings = [
-        {"rule_id": "fb.a11y.html.lang_present_valid", "verdict": "pass"},
-        {"rule_id": "fb.a11y.html.title_present_nonempty", "verdict": "pass"},
-        {"rule_id": "fb.a11y.claim.wcag20aa_level_readiness", "verdict": "warn"},
-    ]
-    native = fullbleed.audit_contract_section508_html_coverage(findings)
-    py_fallback = section508_html_coverage_from_findings(
-        findings, registry=load_section508_html_registry()
-    )
-    assert native == py_fallback
+@pytest.mark.parametrize(
+    ("native_name", "py_fallback", "load_registry", "findings"),
+    [
+        (
+            "audit_contract_wcag20aa_coverage",
+            wcag20aa_coverage_from_findings,
+            load_wcag20aa_registry,
+            [
+                {"rule_id": "fb.a11y.html.lang_present_valid", "verdict": "pass"},
+                {"rule_id": "fb.a11y.html.title_present_nonempty", "verdict": "pass"},
+                {"rule_id": "fb.a11y.ids.duplicate_id", "verdict": "fail"},
+                {"rule_id": "fb.a11y.signatures.text_semantics_present", "verdict": "manual_needed"},
+                {"rule_id": "fb.a11y.aria.reference_target_exists", "verdict": "pass"},
+            ],
+        ),
+        (
+            "audit_contract_section508_html_coverage",
+            section508_html_coverage_from_findings,
+            load_section508_html_registry,
+            [
+                {"rule_id": "fb.a11y.html.lang_present_valid", "verdict": "pass"},
+                {"rule_id": "fb.a11y.html.title_present_nonempty", "verdict": "pass"},
+                {"rule_id": "fb.a11y.claim.wcag20aa_level_readiness", "verdict": "warn"},
+            ],
+        ),
+    ],
+    ids=["wcag20aa", "section508_html"],
+)
+def test_audit_contract_coverage_matches_python_fallback(
+    native_name, py_fallback, load_registry, findings
+) -> None:
+    native = getattr(fullbleed, native_name)(findings)
+    assert native == py_fallback(findings, registry=load_registry())
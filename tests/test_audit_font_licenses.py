@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import importlib.util
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load_tool():
+    spec = importlib.util.spec_from_file_location(
+        "audit_font_licenses", ROOT / "tools" / "audit_font_licenses.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    routes = {
+        "/font.ttf": (200, b"font-bytes"),
+        "/LICENSE": (200, b"SIL Open Font License, Version 1.1"),
+        "/moved": (302, b""),
+        "/no-head": (200, b"get-only"),
+        "/missing": (404, b"not found"),
+    }
+
+    def _respond(self, send_body: bool) -> None:
+        self.server.peers.add(self.client_address)
+        self.server.requests.append((self.command, self.path))
+        status, body = self.routes.get(self.path, (404, b""))
+        if self.command == "HEAD" and self.path == "/no-head":
+            status, body = 405, b""
+        self.send_response(status)
+        if status == 302:
+            self.send_header("Location", "/LICENSE")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def do_HEAD(self) -> None:
+        self._respond(send_body=False)
+
+    def do_GET(self) -> None:
+        self._respond(send_body=True)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.peers = set()
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield httpd, f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_probes_reuse_one_connection_per_host(server) -> None:
+    httpd, base = server
+    tool = _load_tool()
+
+    assert tool._fetch_head_or_get(f"{base}/font.ttf") == (True, b"")
+    assert tool._fetch_license(f"{base}/LICENSE") == (True, b"SIL Open Font License, Version 1.1")
+    assert tool._fetch_head_or_get(f"{base}/font.ttf") == (True, b"")
+
+    assert len(httpd.requests) == 4
+    assert len(httpd.peers) == 1
+
+
+def test_probes_follow_redirects_and_fall_back_to_get(server) -> None:
+    httpd, base = server
+    tool = _load_tool()
+
+    assert tool._fetch_head_or_get(f"{base}/moved") == (True, b"")
+    assert tool._fetch_head_or_get(f"{base}/no-head") == (True, b"get-only")
+    assert tool._fetch_head_or_get(f"{base}/missing") == (False, b"")
+    assert ("HEAD", "/LICENSE") in httpd.requests
+
+
+def test_disallowed_license_skips_probes_and_reports_reason() -> None:
+    tool = _load_tool()
+
+    row = tool._validate_row("odd", {"license": "GPL-3.0", "url": "http://invalid/", "license_url": ""})
+
+    assert row["status"] == "FAIL"
+    assert row["font_url_ok"] is False
+    assert row["license_url_ok"] is False
+    assert row["license_text_ok"] is False
+    assert row["reason"] == "license_not_allowed"
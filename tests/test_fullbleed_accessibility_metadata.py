@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import pytest
+
+from fullbleed.accessibility.engine import _validate_emitted_document_metadata
+
+
+def test_accessibility_engine_metadata_guard_detects_emitted_dom_mismatch() -> None:
+    with pytest.raises(ValueError, match="DOCUMENT_METADATA_MISMATCH"):
+        _validate_emitted_document_metadata(
+            "<!doctype html><html lang='en'><head><title>DOM Title</title></head><body></body></html>",
+            {
+                "document_lang": "en-US",
+                "document_title": "Engine Title",
+            },
+        )
@@ -8,34 +8,98 @@ import pytest
 
 import fullbleed
 
+try:
+    from fullbleed.accessibility import AccessibilityEngine
+except ImportError:  # pragma: no cover - exercised only on broken installs
+    AccessibilityEngine = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup only
+    _json_loads = json.loads
+else:
+    _json_loads = orjson.loads
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 TINY_PNG = base64.b64decode(
     "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/x8AAwMCAO7Z0ioAAAAASUVORK5CYII="
 )
 
 
-def _require_pdf_engine() -> None:
-    if not hasattr(fullbleed, "PdfEngine"):
-        pytest.skip("fullbleed native extension is not available in this test environment")
+def _load_json(path: str | Path) -> dict:
+    return _json_loads(Path(path).read_bytes())
 
 
-def test_accessibility_engine_rejects_pdf_profile_override() -> None:
-    _require_pdf_engine()
+pytestmark = pytest.mark.skipif(
+    AccessibilityEngine is None or not hasattr(fullbleed, "PdfEngine"),
+    reason="fullbleed native extension is not available in this test environment",
+)
 
-    from fullbleed.accessibility import AccessibilityEngine
 
-    with pytest.raises(TypeError):
-        AccessibilityEngine(pdf_profile="tagged")  # type: ignore[arg-type]
+@pytest.fixture(scope="module")
+def engine_default():
+    return AccessibilityEngine(
+        document_lang="en-US",
+        document_title="Accessibility Runtime Smoke",
+        strict=False,
+    )
 
 
-def test_accessibility_engine_strict_mode_requires_metadata(tmp_path: Path) -> None:
-    _require_pdf_engine()
+@pytest.fixture(scope="module")
+def engine_strict():
+    return AccessibilityEngine(
+        document_lang="en-US",
+        document_title="Strict Runtime Guard",
+        document_css_required=False,
+        strict=True,
+    )
+
+
+@pytest.fixture(scope="module")
+def engine_css_meta():
+    return AccessibilityEngine(
+        document_lang="en-US",
+        document_title="CSS Metadata Runtime",
+        document_css_href="styles/runtime.css",
+        document_css_media="print",
+        document_css_required=True,
+        strict=False,
+    )
+
+
+@pytest.fixture(scope="module")
+def strict_engine_no_meta():
+    # Error-path tests only: render_bundle raises on missing metadata before touching engine state.
+    return AccessibilityEngine(strict=True, document_lang=None, document_title=None)
+
+
+@pytest.fixture(scope="module")
+def rendered_smoke_bundle(tmp_path_factory: pytest.TempPathFactory, engine_default):
+    return engine_default.render_bundle(
+        body_html='<main data-fb-role="document-root"><h1>Packet Title</h1><p>Alpha Beta</p></main>',
+        css_text="@page { size: letter; }\nbody { color: #111; }",
+        out_dir=str(tmp_path_factory.mktemp("bundle_smoke")),
+        stem="bundle_smoke",
+        profile="strict",
+        render_preview_png=False,
+        run_verifier=True,
+        run_pmr=True,
+        run_pdf_ua_seed_verify=True,
+        emit_reading_order_trace=True,
+        emit_pdf_structure_trace=True,
+    )
+
+
+def test_accessibility_engine_rejects_pdf_profile_override() -> None:
+    with pytest.raises(TypeError):
+        AccessibilityEngine(pdf_profile="tagged")  # type: ignore[arg-type]
 
-    from fullbleed.accessibility import AccessibilityEngine
 
-    engine = AccessibilityEngine(strict=True, document_lang=None, document_title=None)
+def test_accessibility_engine_strict_mode_requires_metadata(
+    tmp_path: Path, strict_engine_no_meta
+) -> None:
     with pytest.raises(ValueError):
-        engine.render_bundle(
+        strict_engine_no_meta.render_bundle(
             body_html="<main><p>x</p></main>",
             css_text="body { color: #111; }",
             out_dir=str(tmp_path),
@@ -49,26 +113,9 @@ def test_accessibility_engine_strict_mode_requires_metadata(tmp_path: Path) -> N
         )
 
 
-def test_accessibility_engine_metadata_guard_detects_emitted_dom_mismatch() -> None:
-    from fullbleed.accessibility.engine import _validate_emitted_document_metadata
-
-    with pytest.raises(ValueError, match="DOCUMENT_METADATA_MISMATCH"):
-        _validate_emitted_document_metadata(
-            "<!doctype html><html lang='en'><head><title>DOM Title</title></head><body></body></html>",
-            {
-                "document_lang": "en-US",
-                "document_title": "Engine Title",
-            },
-        )
-
-
 def test_accessibility_engine_strict_mode_fails_before_render_on_page_count_regression(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
-    from fullbleed.accessibility import AccessibilityEngine
-
     engine = AccessibilityEngine(
         document_lang="en-US",
         document_title="Pre-render Guard",
@@ -99,19 +146,10 @@ def test_accessibility_engine_strict_mode_fails_before_render_on_page_count_regr
     assert not (out_dir / "pre_render_guard.pdf").exists()
 
 
-def test_accessibility_engine_css_metadata_emits_link_and_reports_fields(tmp_path: Path) -> None:
-    _require_pdf_engine()
-
-    from fullbleed.accessibility import AccessibilityEngine
-
-    engine = AccessibilityEngine(
-        document_lang="en-US",
-        document_title="CSS Metadata Runtime",
-        document_css_href="styles/runtime.css",
-        document_css_media="print",
-        document_css_required=True,
-        strict=False,
-    )
+def test_accessibility_engine_css_metadata_emits_link_and_reports_fields(
+    tmp_path: Path, engine_css_meta, assert_contains_all
+) -> None:
+    engine = engine_css_meta
     meta = engine.document_metadata()
     assert meta["document_css_href"] == "styles/runtime.css"
     assert meta["document_css_media"] == "print"
@@ -132,11 +170,10 @@ def test_accessibility_engine_css_metadata_emits_link_and_reports_fields(tmp_pat
         emit_pdf_structure_trace=False,
     )
 
-    html_text = Path(result.paths["html_path"]).read_text(encoding="utf-8")
-    assert 'href="styles/runtime.css"' in html_text
-    assert 'media="print"' in html_text
+    html_bytes = Path(result.paths["html_path"]).read_bytes()
+    assert_contains_all(html_bytes, (b'href="styles/runtime.css"', b'media="print"'))
 
-    run_report = json.loads(Path(result.paths["run_report_path"]).read_text(encoding="utf-8"))
+    run_report = _load_json(result.paths["run_report_path"])
     assert run_report["document_css_href"] == "styles/runtime.css"
     assert run_report["document_css_media"] == "print"
     assert run_report["document_css_required"] is True
@@ -147,10 +184,6 @@ def test_accessibility_engine_css_metadata_emits_link_and_reports_fields(tmp_pat
 def test_accessibility_engine_verify_artifacts_promote_layout_guard_failures(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
-    from fullbleed.accessibility import AccessibilityEngine
-
     html = tmp_path / "doc.html"
     html.write_text(
         "<!doctype html><html lang='en-US'><head><title>Guard Test</title></head><body><main id='root'><p>Hello</p></main></body></html>",
@@ -226,10 +259,6 @@ def test_accessibility_engine_verify_artifacts_promote_layout_guard_failures(
 def test_accessibility_engine_verify_pmr_artifacts_promote_layout_guard_failures(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
-    from fullbleed.accessibility import AccessibilityEngine
-
     html = tmp_path / "doc.html"
     html.write_text(
         "<!doctype html><html lang='en-US'><head><title>PMR Guard Test</title></head><body><main id='root'><p>Hello</p></main></body></html>",
@@ -308,10 +337,6 @@ def test_accessibility_engine_verify_pmr_artifacts_promote_layout_guard_failures
 def test_accessibility_engine_verify_promotes_typography_spacing_guard(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
-    from fullbleed.accessibility import AccessibilityEngine
-
     html = tmp_path / "doc.html"
     html.write_text(
         "<!doctype html><html lang='en-US'><head><title>Spacing Guard</title></head><body><main id='root'><p>Hello</p></main></body></html>",
@@ -348,10 +373,6 @@ def test_accessibility_engine_verify_promotes_typography_spacing_guard(
 def test_accessibility_engine_verify_promotes_sparse_page_header_guard(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
-    from fullbleed.accessibility import AccessibilityEngine
-
     html = tmp_path / "doc.html"
     html.write_text(
         "<!doctype html><html lang='en-US'><head><title>Sparse Guard</title></head><body><main class='page'><p class='copy'>Case log entry 001</p></main></body></html>",
@@ -430,10 +451,6 @@ def test_accessibility_engine_verify_promotes_sparse_page_header_guard(
 
 
 def test_accessibility_engine_css_required_fails_without_href(tmp_path: Path) -> None:
-    _require_pdf_engine()
-
-    from fullbleed.accessibility import AccessibilityEngine
-
     engine = AccessibilityEngine(
         document_lang="en-US",
         document_title="Missing CSS Href",
@@ -444,29 +461,10 @@ def test_accessibility_engine_css_required_fails_without_href(tmp_path: Path) ->
         engine.emit_html("<main><p>x</p></main>", str(tmp_path / "missing_href.html"))
 
 
-def test_accessibility_engine_render_bundle_emits_pdfua_seed_and_trace_artifacts(tmp_path: Path) -> None:
-    _require_pdf_engine()
-
-    from fullbleed.accessibility import AccessibilityEngine
-
-    engine = AccessibilityEngine(
-        document_lang="en-US",
-        document_title="Accessibility Runtime Smoke",
-        strict=False,
-    )
-    result = engine.render_bundle(
-        body_html='<main data-fb-role="document-root"><h1>Title</h1><p>Hello</p></main>',
-        css_text="@page { size: letter; }\nbody { color: #111; }",
-        out_dir=str(tmp_path),
-        stem="bundle_smoke",
-        profile="strict",
-        render_preview_png=False,
-        run_verifier=True,
-        run_pmr=True,
-        run_pdf_ua_seed_verify=True,
-        emit_reading_order_trace=True,
-        emit_pdf_structure_trace=True,
-    )
+def test_accessibility_engine_render_bundle_emits_pdfua_seed_and_trace_artifacts(
+    rendered_smoke_bundle, assert_contains_all
+) -> None:
+    result = rendered_smoke_bundle
 
     assert result.pdf_ua_targeted is True
     assert result.paths["html_path"].endswith("bundle_smoke.html")
@@ -488,56 +486,41 @@ def test_accessibility_engine_render_bundle_emits_pdfua_seed_and_trace_artifacts
     if hasattr(fullbleed.PdfEngine, "export_render_time_region_text_alignment_trace"):
         assert "region_text_alignment_trace_path" in result.paths
 
-    html_text = Path(result.paths["html_path"]).read_text(encoding="utf-8")
-    assert 'rel="stylesheet"' in html_text
-    assert 'href="bundle_smoke.css"' in html_text
-    assert "<html lang=\"en-US\">" in html_text
-    assert "<title>Accessibility Runtime Smoke</title>" in html_text
+    html_bytes = Path(result.paths["html_path"]).read_bytes()
+    assert_contains_all(
+        html_bytes,
+        (
+            b'rel="stylesheet"',
+            b'href="bundle_smoke.css"',
+            b'<html lang="en-US">',
+            b"<title>Accessibility Runtime Smoke</title>",
+        ),
+    )
 
-    seed = json.loads(Path(result.paths["pdf_ua_seed_verify_path"]).read_text(encoding="utf-8"))
+    seed = _load_json(result.paths["pdf_ua_seed_verify_path"])
     assert seed["schema"] == "fullbleed.pdf.ua_seed_verify.v1"
     assert seed["seed_only"] is True
     assert "checks" in seed
-    assert any(check["id"] == "pdf.structure_root.present" for check in seed["checks"])
+    check_ids = {check["id"] for check in seed["checks"]}
+    assert "pdf.structure_root.present" in check_ids
     if "reading_order_trace_render_path" in result.paths:
-        assert any(
-            check["id"] == "pdf.trace.reading_order.render_time.emitted"
-            for check in seed["checks"]
-        )
-        assert any(
-            check["id"] == "pdf.trace.reading_order.cross_check_seed"
-            for check in seed["checks"]
-        )
+        assert "pdf.trace.reading_order.render_time.emitted" in check_ids
+        assert "pdf.trace.reading_order.cross_check_seed" in check_ids
     if "pdf_structure_trace_render_path" in result.paths:
-        assert any(
-            check["id"] == "pdf.trace.structure.render_time.emitted"
-            for check in seed["checks"]
-        )
-        assert any(
-            check["id"] == "pdf.trace.structure.render_time.tag_balance_seed"
-            for check in seed["checks"]
-        )
-        assert any(
-            check["id"] == "pdf.trace.structure.render_time.tagged_text_presence_seed"
-            for check in seed["checks"]
-        )
-        assert any(
-            check["id"] == "pdf.trace.structure.render_time.untagged_text_ratio_seed"
-            for check in seed["checks"]
-        )
-        assert any(
-            check["id"] == "pdf.trace.structure.cross_check_seed"
-            for check in seed["checks"]
-        )
+        assert "pdf.trace.structure.render_time.emitted" in check_ids
+        assert "pdf.trace.structure.render_time.tag_balance_seed" in check_ids
+        assert "pdf.trace.structure.render_time.tagged_text_presence_seed" in check_ids
+        assert "pdf.trace.structure.render_time.untagged_text_ratio_seed" in check_ids
+        assert "pdf.trace.structure.cross_check_seed" in check_ids
 
-    reading = json.loads(Path(result.paths["reading_order_trace_path"]).read_text(encoding="utf-8"))
+    reading = _load_json(result.paths["reading_order_trace_path"])
     assert reading["schema"] == "fullbleed.pdf.reading_order_trace.v1"
     assert reading["schema_version"] == 1
     assert "summary" in reading
     if hasattr(fullbleed, "export_pdf_reading_order_trace"):
         assert reading["extractor"] == "lopdf"
 
-    structure = json.loads(Path(result.paths["pdf_structure_trace_path"]).read_text(encoding="utf-8"))
+    structure = _load_json(result.paths["pdf_structure_trace_path"])
     assert structure["schema"] == "fullbleed.pdf.structure_trace.v1"
     assert structure["schema_version"] == 1
     assert "token_counts" in structure
@@ -545,51 +528,39 @@ def test_accessibility_engine_render_bundle_emits_pdfua_seed_and_trace_artifacts
         assert structure["extractor"] == "lopdf"
 
     if "reading_order_trace_render_path" in result.paths:
-        reading_render = json.loads(
-            Path(result.paths["reading_order_trace_render_path"]).read_text(encoding="utf-8")
-        )
+        reading_render = _load_json(result.paths["reading_order_trace_render_path"])
         assert reading_render["schema"] == "fullbleed.pdf.reading_order_trace.v1"
         assert reading_render["extractor"] == "render_time_commands"
         assert "summary" in reading_render
 
     if "pdf_structure_trace_render_path" in result.paths:
-        structure_render = json.loads(
-            Path(result.paths["pdf_structure_trace_render_path"]).read_text(encoding="utf-8")
-        )
+        structure_render = _load_json(result.paths["pdf_structure_trace_render_path"])
         assert structure_render["schema"] == "fullbleed.pdf.structure_trace.v1"
         assert structure_render["extractor"] == "render_time_commands"
         assert "summary" in structure_render
     if "font_resolution_trace_path" in result.paths:
-        font_trace = json.loads(
-            Path(result.paths["font_resolution_trace_path"]).read_text(encoding="utf-8")
-        )
+        font_trace = _load_json(result.paths["font_resolution_trace_path"])
         assert font_trace["schema"] == "fullbleed.font_resolution_trace.v1"
         assert font_trace["schema_version"] == 1
         assert font_trace["extractor"] == "render_time_commands"
         assert font_trace["summary"]["font_count"] >= 1
     if "pagination_trace_path" in result.paths:
-        pagination_trace = json.loads(
-            Path(result.paths["pagination_trace_path"]).read_text(encoding="utf-8")
-        )
+        pagination_trace = _load_json(result.paths["pagination_trace_path"])
         assert pagination_trace["schema"] == "fullbleed.pagination_trace.v1"
         assert pagination_trace["schema_version"] == 1
         assert pagination_trace["summary"]["page_count"] >= 1
     if "typography_drift_trace_path" in result.paths:
-        typography_trace = json.loads(
-            Path(result.paths["typography_drift_trace_path"]).read_text(encoding="utf-8")
-        )
+        typography_trace = _load_json(result.paths["typography_drift_trace_path"])
         assert typography_trace["schema"] == "fullbleed.typography_drift_trace.v1"
         assert typography_trace["schema_version"] == 1
         assert typography_trace["summary"]["block_count"] >= 1
     if "region_text_alignment_trace_path" in result.paths:
-        region_trace = json.loads(
-            Path(result.paths["region_text_alignment_trace_path"]).read_text(encoding="utf-8")
-        )
+        region_trace = _load_json(result.paths["region_text_alignment_trace_path"])
         assert region_trace["schema"] == "fullbleed.region_text_alignment_trace.v1"
         assert region_trace["schema_version"] == 1
         assert "summary" in region_trace
 
-    run_report = json.loads(Path(result.paths["run_report_path"]).read_text(encoding="utf-8"))
+    run_report = _load_json(result.paths["run_report_path"])
     assert run_report["pdf_ua_targeted"] is True
     assert run_report["engine_pdf_profile_requested"] == "pdfua"
     assert run_report["engine_pdf_profile_effective"] == "tagged"
@@ -612,12 +583,8 @@ def test_accessibility_engine_render_bundle_emits_pdfua_seed_and_trace_artifacts
             "bundle_smoke_pagination_trace.json"
         )
         assert run_report["pagination_trace_summary"]["page_count"] >= 1
-        verifier_report = json.loads(
-            Path(result.paths["engine_a11y_verify_path"]).read_text(encoding="utf-8")
-        )
-        pmr_report = json.loads(
-            Path(result.paths["engine_pmr_path"]).read_text(encoding="utf-8")
-        )
+        verifier_report = _load_json(result.paths["engine_a11y_verify_path"])
+        pmr_report = _load_json(result.paths["engine_pmr_path"])
         assert verifier_report["pagination_trace_summary"]["page_count"] >= 1
         assert pmr_report["pagination_trace_summary"]["page_count"] >= 1
         assert (
@@ -662,7 +629,6 @@ def test_accessibility_engine_render_bundle_emits_pdfua_seed_and_trace_artifacts
 
 
 def test_pdf_engine_font_resolution_trace_reports_registered_file_targets() -> None:
-    _require_pdf_engine()
     if not hasattr(fullbleed.PdfEngine, "export_render_time_font_resolution_trace"):
         pytest.skip("font resolution trace export is not available in this build")
 
@@ -685,7 +651,6 @@ def test_pdf_engine_font_resolution_trace_reports_registered_file_targets() -> N
 
 
 def test_pdf_engine_font_resolution_trace_reports_missing_font_fallbacks() -> None:
-    _require_pdf_engine()
     if not hasattr(fullbleed.PdfEngine, "export_render_time_font_resolution_trace"):
         pytest.skip("font resolution trace export is not available in this build")
 
@@ -706,7 +671,6 @@ def test_pdf_engine_font_resolution_trace_reports_missing_font_fallbacks() -> No
 
 
 def test_pdf_engine_pagination_trace_reports_page_transitions() -> None:
-    _require_pdf_engine()
     if not hasattr(fullbleed.PdfEngine, "export_render_time_pagination_trace"):
         pytest.skip("pagination trace export is not available in this build")
 
@@ -728,7 +692,6 @@ def test_pdf_engine_pagination_trace_reports_page_transitions() -> None:
 def test_pdf_engine_asset_resolution_trace_resolves_file_uri_sources(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
     if not hasattr(fullbleed.PdfEngine, "export_render_time_asset_resolution_trace"):
         pytest.skip("asset resolution trace export is not available in this build")
 
@@ -752,12 +715,9 @@ def test_pdf_engine_asset_resolution_trace_resolves_file_uri_sources(
 def test_accessibility_engine_render_bundle_emits_asset_resolution_trace_for_bundle_images(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
     if not hasattr(fullbleed.PdfEngine, "export_render_time_asset_resolution_trace"):
         pytest.skip("asset resolution trace export is not available in this build")
 
-    from fullbleed.accessibility import AccessibilityEngine
-
     image_path = tmp_path / "bundle_tiny.png"
     image_path.write_bytes(TINY_PNG)
     bundle = fullbleed.AssetBundle()
@@ -783,13 +743,13 @@ def test_accessibility_engine_render_bundle_emits_asset_resolution_trace_for_bun
     )
 
     assert "asset_resolution_trace_path" in result.paths
-    trace = json.loads(Path(result.paths["asset_resolution_trace_path"]).read_text(encoding="utf-8"))
+    trace = _load_json(result.paths["asset_resolution_trace_path"])
     entry = trace["assets"][0]
     assert entry["resolver"] == "bundle"
     assert entry["success"] is True
     assert entry["asset_name"] == "bundle_tiny.png"
 
-    run_report = json.loads(Path(result.paths["run_report_path"]).read_text(encoding="utf-8"))
+    run_report = _load_json(result.paths["run_report_path"])
     assert run_report["deliverables"]["asset_resolution_trace_path"] == (
         "bundle_trace_asset_resolution_trace.json"
     )
@@ -797,20 +757,12 @@ def test_accessibility_engine_render_bundle_emits_asset_resolution_trace_for_bun
 
 
 def test_accessibility_engine_strict_mode_fails_on_unresolved_image_sources(
-    tmp_path: Path,
+    tmp_path: Path, engine_strict
 ) -> None:
-    _require_pdf_engine()
     if not hasattr(fullbleed.PdfEngine, "export_render_time_asset_resolution_trace"):
         pytest.skip("asset resolution trace export is not available in this build")
 
-    from fullbleed.accessibility import AccessibilityEngine
-
-    engine = AccessibilityEngine(
-        document_lang="en-US",
-        document_title="Strict Missing Image",
-        document_css_required=False,
-        strict=True,
-    )
+    engine = engine_strict
     with pytest.raises(ValueError, match="unresolved image source"):
         engine.render_bundle(
             body_html='<main data-fb-role="document-root"><img src="missing-image.png" alt="Missing"></main>',
@@ -827,20 +779,12 @@ def test_accessibility_engine_strict_mode_fails_on_unresolved_image_sources(
 
 
 def test_accessibility_engine_strict_mode_fails_on_page_count_divergence(
-    tmp_path: Path,
+    tmp_path: Path, engine_strict
 ) -> None:
-    _require_pdf_engine()
     if not hasattr(fullbleed.PdfEngine, "export_render_time_pagination_trace"):
         pytest.skip("pagination trace export is not available in this build")
 
-    from fullbleed.accessibility import AccessibilityEngine
-
-    engine = AccessibilityEngine(
-        document_lang="en-US",
-        document_title="Strict Page Divergence",
-        document_css_required=False,
-        strict=True,
-    )
+    engine = engine_strict
     with pytest.raises(ValueError, match="page count divergence detected"):
         engine.render_bundle(
             body_html='<main data-fb-role="document-root"><p>Single page</p></main>',
@@ -858,19 +802,12 @@ def test_accessibility_engine_strict_mode_fails_on_page_count_divergence(
 
 
 def test_accessibility_engine_render_bundle_promotes_page_break_owner_diagnostics(
-    tmp_path: Path,
+    tmp_path: Path, engine_default
 ) -> None:
-    _require_pdf_engine()
     if not hasattr(fullbleed.PdfEngine, "export_render_time_pagination_trace"):
         pytest.skip("pagination trace export is not available in this build")
 
-    from fullbleed.accessibility import AccessibilityEngine
-
-    engine = AccessibilityEngine(
-        document_lang="en-US",
-        document_title="Ownership Diagnostics",
-        strict=False,
-    )
+    engine = engine_default
     result = engine.render_bundle(
         body_html=(
             '<main data-fb-role="document-root">'
@@ -890,10 +827,8 @@ def test_accessibility_engine_render_bundle_promotes_page_break_owner_diagnostic
         emit_pdf_structure_trace=False,
     )
 
-    verifier_report = json.loads(
-        Path(result.paths["engine_a11y_verify_path"]).read_text(encoding="utf-8")
-    )
-    pmr_report = json.loads(Path(result.paths["engine_pmr_path"]).read_text(encoding="utf-8"))
+    verifier_report = _load_json(result.paths["engine_a11y_verify_path"])
+    pmr_report = _load_json(result.paths["engine_pmr_path"])
 
     assert any(
         row["dominant_owner_label"] == "appendix"
@@ -906,20 +841,12 @@ def test_accessibility_engine_render_bundle_promotes_page_break_owner_diagnostic
 
 
 def test_accessibility_engine_definition_list_text_is_tagged_in_render_trace(
-    tmp_path: Path,
+    tmp_path: Path, engine_default
 ) -> None:
-    _require_pdf_engine()
-
     if not hasattr(fullbleed.PdfEngine, "export_render_time_structure_trace"):
         pytest.skip("render-time structure trace export is not available in this build")
 
-    from fullbleed.accessibility import AccessibilityEngine
-
-    engine = AccessibilityEngine(
-        document_lang="en-US",
-        document_title="Definition List Tagging",
-        strict=False,
-    )
+    engine = engine_default
     result = engine.render_bundle(
         body_html=(
             '<main data-fb-role="document-root">'
@@ -942,9 +869,7 @@ def test_accessibility_engine_definition_list_text_is_tagged_in_render_trace(
         emit_pdf_structure_trace=True,
     )
 
-    structure_render = json.loads(
-        Path(result.paths["pdf_structure_trace_render_path"]).read_text(encoding="utf-8")
-    )
+    structure_render = _load_json(result.paths["pdf_structure_trace_render_path"])
     assert structure_render["extractor"] == "render_time_commands"
     assert structure_render["summary"]["tagged_text_draw_count"] >= 5
     assert structure_render["summary"]["untagged_text_draw_count"] == 0
@@ -955,35 +880,17 @@ def test_accessibility_engine_definition_list_text_is_tagged_in_render_trace(
     assert token_counts.get("LBody", 0) >= 2
 
 
-def test_native_pdf_page_text_extraction_uses_engine_extension(tmp_path: Path) -> None:
-    _require_pdf_engine()
-    if not hasattr(fullbleed, "extract_pdf_page_texts"):
-        pytest.skip("native pdf page text extraction is not available in this build")
-
-    from fullbleed.accessibility import AccessibilityEngine
-
-    engine = AccessibilityEngine(
-        document_lang="en-US",
-        document_title="PDF Text Extract Smoke",
-        strict=False,
-    )
-    result = engine.render_bundle(
-        body_html='<main data-fb-role="document-root"><h1>Packet Title</h1><p>Alpha Beta</p></main>',
-        css_text="@page { size: letter; } body { color: #111; }",
-        out_dir=str(tmp_path),
-        stem="pdf_text_extract",
-        profile="strict",
-        render_preview_png=False,
-        run_verifier=False,
-        run_pmr=False,
-        run_pdf_ua_seed_verify=False,
-        emit_reading_order_trace=False,
-        emit_pdf_structure_trace=False,
-    )
-    report = fullbleed.extract_pdf_page_texts(result.paths["pdf_path"])
+@pytest.mark.skipif(
+    not hasattr(fullbleed, "extract_pdf_page_texts"),
+    reason="native pdf page text extraction is not available in this build",
+)
+def test_native_pdf_page_text_extraction_uses_engine_extension(rendered_smoke_bundle) -> None:
+    report = fullbleed.extract_pdf_page_texts(rendered_smoke_bundle.paths["pdf_path"])
     assert report["schema"] == "fullbleed.pdf.page_text_extract.v1"
     assert report["extractor"] == "lopdf"
     assert report["ok"] is True
     assert report["summary"]["page_count"] >= 1
     assert len(report["pages"]) >= 1
-    assert "Packet Title" in (report["pages"][0]["text"] or "")
+    page_text = report["pages"][0]["text"] or ""
+    assert "Packet Title" in page_text
+    assert "Alpha Beta" in page_text
@@ -13,9 +13,10 @@ ROOT = Path(__file__).resolve().parents[1]
 SPECS = ROOT / "docs" / "specs"
 
 
-def _require_pdf_engine() -> None:
-    if not hasattr(fullbleed, "PdfEngine"):
-        pytest.skip("fullbleed native extension is not available in this test environment")
+pytestmark = pytest.mark.skipif(
+    not hasattr(fullbleed, "PdfEngine"),
+    reason="fullbleed native extension is not available in this test environment",
+)
 
 
 def _write(path: Path, text: str) -> Path:
@@ -47,8 +48,6 @@ def jsonschema_module():
 def test_pdf_engine_verify_accessibility_artifacts_emits_schema_valid_report(
     tmp_path: Path, jsonschema_module
 ) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "doc.html",
         (
@@ -111,8 +110,6 @@ def test_pdf_engine_verify_accessibility_artifacts_emits_schema_valid_report(
 def test_pdf_engine_verify_accessibility_artifacts_surfaces_pagination_trace_summary(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "doc.html",
         (
@@ -149,8 +146,6 @@ def test_pdf_engine_verify_accessibility_artifacts_surfaces_pagination_trace_sum
 def test_pdf_engine_verify_accessibility_artifacts_surfaces_diagnostic_reason_codes(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "doc.html",
         (
@@ -222,8 +217,6 @@ def test_pdf_engine_verify_accessibility_artifacts_surfaces_diagnostic_reason_co
 def test_pdf_engine_verify_accessibility_artifacts_promotes_blocking_issue_summary(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "doc.html",
         (
@@ -267,8 +260,6 @@ def test_pdf_engine_verify_accessibility_artifacts_promotes_blocking_issue_summa
 def test_pdf_engine_verify_accessibility_artifacts_fails_fast_for_ids_and_idrefs(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "bad.html",
         (
@@ -300,8 +291,6 @@ def test_pdf_engine_verify_accessibility_artifacts_fails_fast_for_ids_and_idrefs
 def test_engine_verifier_signature_semantics_fail_is_warn_level_gate(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "sig.html",
         (
@@ -336,8 +325,6 @@ def test_engine_verifier_signature_semantics_fail_is_warn_level_gate(
 
 
 def test_engine_verifier_matches_prototype_for_shared_core_rules(tmp_path: Path) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "doc.html",
         (
@@ -427,8 +414,6 @@ def test_engine_verifier_matches_prototype_for_shared_core_rules(tmp_path: Path)
 def test_engine_verifier_flags_empty_headings_labels_and_unlabeled_regions(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "doc.html",
         (
@@ -458,8 +443,6 @@ def test_engine_verifier_flags_empty_headings_labels_and_unlabeled_regions(
 
 
 def test_engine_verifier_flags_image_missing_alt_and_title_only(tmp_path: Path) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "images.html",
         (
@@ -492,8 +475,6 @@ def test_engine_verifier_flags_image_missing_alt_and_title_only(tmp_path: Path)
 def test_engine_verifier_emits_figure_alt_budget_redundancy_and_effective_text_rules(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
     long_alt = (
         "Scanned warranty deed certification block showing county certificate text, "
         "signatures, notary references, and recording stamp details for Escambia County Florida."
@@ -539,8 +520,6 @@ def test_engine_verifier_emits_figure_alt_budget_redundancy_and_effective_text_r
 def test_engine_verifier_emits_dl_fragmentation_and_group_consistency_rules(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "dl-rules.html",
         (
@@ -570,8 +549,6 @@ def test_engine_verifier_emits_dl_fragmentation_and_group_consistency_rules(
 
 
 def test_engine_verifier_emits_redundant_aria_native_rules(tmp_path: Path) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "aria-native-rules.html",
         (
@@ -602,8 +579,6 @@ def test_engine_verifier_emits_redundant_aria_native_rules(tmp_path: Path) -> No
 
 
 def test_engine_verifier_flags_unlabeled_form_controls(tmp_path: Path) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "forms.html",
         (
@@ -636,8 +611,6 @@ def test_engine_verifier_flags_unlabeled_form_controls(tmp_path: Path) -> None:
 def test_engine_verifier_flags_invalid_controls_without_error_identification(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "errors.html",
         (
@@ -670,8 +643,6 @@ def test_engine_verifier_flags_invalid_controls_without_error_identification(
 def test_engine_verifier_detects_unnamed_and_generic_link_purpose_signals(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "links.html",
         (
@@ -701,8 +672,6 @@ def test_engine_verifier_detects_unnamed_and_generic_link_purpose_signals(
 def test_engine_verifier_warns_on_sensory_characteristics_instruction_phrases(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "sensory.html",
         (
@@ -734,8 +703,6 @@ def test_engine_verifier_warns_on_sensory_characteristics_instruction_phrases(
 def test_engine_verifier_flags_invalid_language_of_parts_declarations(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "lang-parts.html",
         (
@@ -764,8 +731,6 @@ def test_engine_verifier_flags_invalid_language_of_parts_declarations(
 
 
 def test_engine_verifier_warns_on_non_interference_risk_signals(tmp_path: Path) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "active.html",
         (
@@ -806,8 +771,6 @@ def test_engine_verifier_warns_on_non_interference_risk_signals(tmp_path: Path)
 def test_engine_verifier_marks_complete_processes_scope_seed_manual_for_transactional_profile(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "txn.html",
         "<!doctype html><html lang='en-US'><head><title>Txn</title></head><body><main></main></body></html>",
@@ -835,8 +798,6 @@ def test_engine_verifier_marks_complete_processes_scope_seed_manual_for_transact
 
 
 def test_engine_verifier_emits_section508_e205_claim_seed_rules(tmp_path: Path) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "s508.html",
         "<!doctype html><html lang='en-US'><head><title>S508</title></head><body><main></main></body></html>",
@@ -861,8 +822,6 @@ def test_engine_verifier_emits_section508_e205_claim_seed_rules(tmp_path: Path)
 
 
 def test_engine_verifier_claim_evidence_can_satisfy_claim_seed_rules(tmp_path: Path) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "claim.html",
         (
@@ -1106,8 +1065,6 @@ def test_engine_verifier_claim_evidence_can_satisfy_claim_seed_rules(tmp_path: P
 
 
 def test_engine_verifier_focus_visible_seed_uses_css_focus_and_outline_signals(tmp_path: Path) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "focus.html",
         (
@@ -1142,8 +1099,6 @@ def test_engine_verifier_focus_visible_seed_uses_css_focus_and_outline_signals(t
 def test_engine_verifier_keyboard_seed_warns_on_pointer_only_custom_click_handlers(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "keyboard-pointer-only.html",
         (
@@ -1176,8 +1131,6 @@ def test_engine_verifier_keyboard_seed_warns_on_pointer_only_custom_click_handle
 def test_engine_verifier_focus_order_seed_warns_on_positive_tabindex_and_passes_without_it(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
     html_warn = _write(
         tmp_path / "focus-order-warn.html",
         (
@@ -1216,8 +1169,6 @@ def test_engine_verifier_focus_order_seed_warns_on_positive_tabindex_and_passes_
 def test_engine_verifier_bridges_a11y_contract_diagnostics_and_dedups_aggregate_rules(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
     html = _write(
         tmp_path / "bridge.html",
         (
@@ -1273,8 +1224,6 @@ def test_engine_verifier_bridges_a11y_contract_diagnostics_and_dedups_aggregate_
 
 
 def test_engine_verifier_warns_on_low_render_contrast_seed(tmp_path: Path) -> None:
-    _require_pdf_engine()
-
     html_text = (
         "<!doctype html><html lang='en-US'><head><title>Contrast</title></head><body>"
         "<main><p class='c'>Low Contrast Sample</p></main></body></html>"
@@ -1308,8 +1257,6 @@ def test_engine_verifier_warns_on_low_render_contrast_seed(tmp_path: Path) -> No
 def test_engine_sparse_page_visual_pair_detects_header_omission(
     tmp_path: Path,
 ) -> None:
-    _require_pdf_engine()
-
     engine = fullbleed.PdfEngine(
         document_lang="en-US",
         document_title="Sparse Pair",
@@ -7,14 +7,15 @@ import pytest
 import fullbleed
 
 
-def _require_pdf_engine() -> None:
-    if not hasattr(fullbleed, "PdfEngine"):
-        pytest.skip("fullbleed native extension is not available in this test environment")
+pytestmark = pytest.mark.skipif(
+    not hasattr(fullbleed, "PdfEngine"),
+    reason="fullbleed native extension is not available in this test environment",
+)
 
 
-def test_pdf_engine_emit_artifacts_preserves_document_metadata(tmp_path: Path) -> None:
-    _require_pdf_engine()
-
+def test_pdf_engine_emit_artifacts_preserves_document_metadata(
+    tmp_path: Path, assert_contains_all
+) -> None:
     engine = fullbleed.PdfEngine(
         document_lang="en-US",
         document_title='Engine "Doc" <A&B>',
@@ -47,27 +48,64 @@ def test_pdf_engine_emit_artifacts_preserves_document_metadata(tmp_path: Path) -
         str(css_path),
     )
 
-    html_text = html_path.read_text(encoding="utf-8")
-    css_text = css_path.read_text(encoding="utf-8")
+    html_text = result["html"]
 
     assert result["html_path"] == str(html_path)
     assert result["css_path"] == str(css_path)
-    assert result["html"] == html_text
-    assert result["css"] == css_text
-    assert css_text == css
-    assert '<html lang="fr-CA">' in html_text
-    assert "<title>Updated &quot;Title&quot; &lt;x&amp;y&gt;</title>" in html_text
-    assert '<link rel="stylesheet" href="styles/engine.css" media="print" />' in html_text
-    assert body_html in html_text
+    assert html_path.read_bytes() == html_text.encode("utf-8")
+    assert css_path.read_bytes() == css.encode("utf-8")
+    assert result["css"] == css
+    assert_contains_all(
+        html_text,
+        (
+            '<html lang="fr-CA">',
+            "<title>Updated &quot;Title&quot; &lt;x&amp;y&gt;</title>",
+            '<link rel="stylesheet" href="styles/engine.css" media="print" />',
+            body_html,
+        ),
+    )
     assert result["css_link_href"] == "styles/engine.css"
     assert result["css_link_media"] == "print"
     assert result["css_link_preexisting"] is False
 
 
-def test_pdf_engine_document_metadata_properties_accept_none(tmp_path: Path) -> None:
-    _require_pdf_engine()
+def test_pdf_engine_emit_artifacts_many_matches_single_emit(tmp_path: Path, engine) -> None:
+    if not hasattr(fullbleed.PdfEngine, "emit_artifacts_many"):
+        pytest.skip("batched artifact emission is not available in this build")
+
+    engine.document_title = "Batch"
+    engine.document_css_href = "batch.css"
+    docs = [
+        (f"<main><p>doc {idx}</p></main>", f"body {{ margin: {idx}pt; }}")
+        for idx in range(3)
+    ]
 
-    engine = fullbleed.PdfEngine(document_lang="en-US", document_title="Alpha")
+    batched = engine.emit_artifacts_many(
+        [
+            (body, css, str(tmp_path / "batch" / f"doc{idx}.html"), str(tmp_path / "batch" / f"doc{idx}.css"))
+            for idx, (body, css) in enumerate(docs)
+        ]
+    )
+    single = [
+        engine.emit_artifacts(
+            body,
+            css,
+            str(tmp_path / "single" / f"doc{idx}.html"),
+            str(tmp_path / "single" / f"doc{idx}.css"),
+        )
+        for idx, (body, css) in enumerate(docs)
+    ]
+
+    assert len(batched) == len(docs)
+    for batch_row, single_row in zip(batched, single):
+        assert batch_row["html"] == single_row["html"]
+        assert batch_row["css"] == single_row["css"]
+        assert Path(batch_row["html_path"]).read_bytes() == batch_row["html"].encode("utf-8")
+
+
+def test_pdf_engine_document_metadata_properties_accept_none(
+    tmp_path: Path, engine, assert_contains_all
+) -> None:
     engine.document_lang = None
     engine.document_title = None
     engine.document_css_href = None
@@ -84,16 +122,13 @@ def test_pdf_engine_document_metadata_properties_accept_none(tmp_path: Path) ->
 
     html_path = tmp_path / "raw.html"
     css_path = tmp_path / "raw.css"
-    engine.emit_artifacts("<div>x</div>", "body{}", str(html_path), str(css_path))
-    html_text = html_path.read_text(encoding="utf-8")
-    assert '<html lang="en">' in html_text
-    assert "<title>fullbleed document</title>" in html_text
-
+    result = engine.emit_artifacts("<div>x</div>", "body{}", str(html_path), str(css_path))
+    assert html_path.is_file()
+    html_text = result["html"]
+    assert_contains_all(html_text, ('<html lang="en">', "<title>fullbleed document</title>"))
 
-def test_pdf_engine_css_required_fails_without_href(tmp_path: Path) -> None:
-    _require_pdf_engine()
 
-    engine = fullbleed.PdfEngine(document_lang="en-US", document_title="Strict CSS")
+def test_pdf_engine_css_required_fails_without_href(tmp_path: Path, engine) -> None:
     engine.document_css_required = True
 
     html_path = tmp_path / "strict.html"
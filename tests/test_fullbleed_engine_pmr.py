@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
 import pytest
@@ -8,14 +11,22 @@ import pytest
 import fullbleed
 from fullbleed.audit_prototype import prototype_verify_paged_media_rank
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup only
+    _json_loads = json.loads
+else:
+    _json_loads = orjson.loads
+
 
 ROOT = Path(__file__).resolve().parents[1]
 SPECS = ROOT / "docs" / "specs"
 
 
-def _require_pdf_engine() -> None:
-    if not hasattr(fullbleed, "PdfEngine"):
-        pytest.skip("fullbleed native extension is not available in this test environment")
+pytestmark = pytest.mark.skipif(
+    not hasattr(fullbleed, "PdfEngine"),
+    reason="fullbleed native extension is not available in this test environment",
+)
 
 
 def _write(path: Path, text: str) -> Path:
@@ -24,18 +35,55 @@ def _write(path: Path, text: str) -> Path:
     return path
 
 
+def _centipoints(score: float) -> int:
+    # Engine and prototype both round rank scores to 0.01, so compare them as integers.
+    return int(round(float(score) * 100))
+
+
+def _verdicts(report: dict) -> dict[str, list[str]]:
+    # Stable sort keeps per-audit verdict order, matching a setdefault-append walk.
+    by_id = itemgetter("audit_id")
+    return {
+        audit_id: [audit["verdict"] for audit in group]
+        for audit_id, group in groupby(sorted(report["audits"], key=by_id), key=by_id)
+    }
+
+
+@pytest.fixture(scope="module")
+def pmr_baseline_artifacts(tmp_path_factory) -> tuple[Path, Path]:
+    root = tmp_path_factory.mktemp("pmr")
+    html = _write(
+        root / "baseline.html",
+        "<!doctype html><html lang='en-US'><head><title>PMR Baseline</title></head><body><main><p>Hello</p></main></body></html>",
+    )
+    css = _write(root / "doc.css", "body{font-family:Helvetica}")
+    return html, css
+
+
+@pytest.fixture(scope="module")
+def pmr_empty_css(pmr_baseline_artifacts) -> Path:
+    _, css = pmr_baseline_artifacts
+    return _write(css.parent / "empty.css", "body{}")
+
+
 @pytest.fixture(scope="module")
 def jsonschema_module():
     return pytest.importorskip("jsonschema")
 
 
+@pytest.fixture(scope="module")
+def pmr_validator(jsonschema_module):
+    schema = _json_loads((SPECS / "fullbleed.pmr.v1.schema.json").read_bytes())
+    jsonschema_module.Draft202012Validator.check_schema(schema)
+    return jsonschema_module.Draft202012Validator(schema)
+
+
 def test_pdf_engine_verify_paged_media_rank_artifacts_emits_schema_valid_report(
-    tmp_path: Path, jsonschema_module
+    engine, pmr_baseline_artifacts, pmr_validator
 ) -> None:
-    _require_pdf_engine()
-
+    _, css = pmr_baseline_artifacts
     html = _write(
-        tmp_path / "doc.html",
+        css.parent / "schema_valid.html",
         (
             "<!doctype html><html lang='en-US'><head><title>PMR Doc</title>"
             "<link rel='stylesheet' href='doc.css'></head><body><main id='root'>"
@@ -44,9 +92,9 @@ def test_pdf_engine_verify_paged_media_rank_artifacts_emits_schema_valid_report(
             "</main></body></html>"
         ),
     )
-    css = _write(tmp_path / "doc.css", "body{font-family:Helvetica}")
 
-    engine = fullbleed.PdfEngine(document_lang="en-US", document_title="PMR Doc")
+    engine.document_lang = "en-US"
+    engine.document_title = "PMR Doc"
     report = engine.verify_paged_media_rank_artifacts(
         str(html),
         str(css),
@@ -59,8 +107,8 @@ def test_pdf_engine_verify_paged_media_rank_artifacts_emits_schema_valid_report(
         review_queue_items=0,
     )
 
-    schema = json.loads((SPECS / "fullbleed.pmr.v1.schema.json").read_text(encoding="utf-8"))
-    jsonschema_module.Draft202012Validator(schema).validate(report)
+    error = next(pmr_validator.iter_errors(report), None)
+    assert error is None, error
 
     assert report["schema"] == "fullbleed.pmr.v1"
     assert report["gate"]["ok"] is True
@@ -75,17 +123,11 @@ def test_pdf_engine_verify_paged_media_rank_artifacts_emits_schema_valid_report(
 
 
 def test_pdf_engine_verify_paged_media_rank_artifacts_prefers_pagination_trace_summary(
-    tmp_path: Path,
+    engine, pmr_baseline_artifacts
 ) -> None:
-    _require_pdf_engine()
-
-    html = _write(
-        tmp_path / "doc.html",
-        "<!doctype html><html lang='en-US'><head><title>PMR Pagination</title></head><body><main><p>Hello</p></main></body></html>",
-    )
-    css = _write(tmp_path / "doc.css", "body{font-family:Helvetica}")
-
-    engine = fullbleed.PdfEngine(document_lang="en-US", document_title="PMR Pagination")
+    html, css = pmr_baseline_artifacts
+    engine.document_lang = "en-US"
+    engine.document_title = "PMR Baseline"
     report = engine.verify_paged_media_rank_artifacts(
         str(html),
         str(css),
@@ -120,17 +162,11 @@ def test_pdf_engine_verify_paged_media_rank_artifacts_prefers_pagination_trace_s
 
 
 def test_pdf_engine_verify_paged_media_rank_artifacts_surfaces_diagnostic_reason_codes(
-    tmp_path: Path,
+    engine, pmr_baseline_artifacts
 ) -> None:
-    _require_pdf_engine()
-
-    html = _write(
-        tmp_path / "doc.html",
-        "<!doctype html><html lang='en-US'><head><title>PMR Diagnostics</title></head><body><main><p>Hello</p></main></body></html>",
-    )
-    css = _write(tmp_path / "doc.css", "body{font-family:Helvetica}")
-
-    engine = fullbleed.PdfEngine(document_lang="en-US", document_title="PMR Diagnostics")
+    html, css = pmr_baseline_artifacts
+    engine.document_lang = "en-US"
+    engine.document_title = "PMR Baseline"
     report = engine.verify_paged_media_rank_artifacts(
         str(html),
         str(css),
@@ -196,17 +232,16 @@ def test_pdf_engine_verify_paged_media_rank_artifacts_surfaces_diagnostic_reason
 
 
 def test_pdf_engine_verify_paged_media_rank_artifacts_promotes_metadata_mismatch_summary(
-    tmp_path: Path,
+    engine, pmr_baseline_artifacts
 ) -> None:
-    _require_pdf_engine()
-
+    _, css = pmr_baseline_artifacts
     html = _write(
-        tmp_path / "doc.html",
+        css.parent / "metadata_mismatch.html",
         "<!doctype html><html lang='en'><head><title>DOM Title</title></head><body><main><p>Hello</p></main></body></html>",
     )
-    css = _write(tmp_path / "doc.css", "body{font-family:Helvetica}")
 
-    engine = fullbleed.PdfEngine(document_lang="en-US", document_title="Engine Title")
+    engine.document_lang = "en-US"
+    engine.document_title = "Engine Title"
     report = engine.verify_paged_media_rank_artifacts(
         str(html),
         str(css),
@@ -237,19 +272,18 @@ def test_pdf_engine_verify_paged_media_rank_artifacts_promotes_metadata_mismatch
     )
 
 
-def test_pdf_engine_verify_paged_media_rank_cav_fail_fast_regressions(tmp_path: Path) -> None:
-    _require_pdf_engine()
-
+def test_pdf_engine_verify_paged_media_rank_cav_fail_fast_regressions(engine, pmr_empty_css) -> None:
+    css = pmr_empty_css
     html = _write(
-        tmp_path / "bad.html",
+        css.parent / "bad.html",
         (
             "<!doctype html><html lang='en-US'><head><title>Bad CAV</title></head><body><main>"
             "<p>Review queue: 4 items pending</p>"
             "</main></body></html>"
         ),
     )
-    css = _write(tmp_path / "bad.css", "body{}")
-    engine = fullbleed.PdfEngine(document_lang="en-US", document_title="Bad CAV")
+    engine.document_lang = "en-US"
+    engine.document_title = "Bad CAV"
     report = engine.verify_paged_media_rank_artifacts(
         str(html),
         str(css),
@@ -263,9 +297,9 @@ def test_pdf_engine_verify_paged_media_rank_cav_fail_fast_regressions(tmp_path:
     )
 
     assert report["gate"]["ok"] is False
-    failed = set(report["gate"]["failed_audit_ids"])
-    assert "pmr.layout.page_count_target" in failed
-    assert "pmr.cav.document_only_content" in failed
+    assert frozenset({"pmr.layout.page_count_target", "pmr.cav.document_only_content"}).issubset(
+        report["gate"]["failed_audit_ids"]
+    )
     corr = {row["audit_id"]: row for row in report["observability"]["correlation_index"]}
     assert "pmr.layout.page_count_target" in corr
     assert "pmr.cav.document_only_content" in corr
@@ -273,11 +307,11 @@ def test_pdf_engine_verify_paged_media_rank_cav_fail_fast_regressions(tmp_path:
     assert corr["pmr.cav.document_only_content"]["gate_failed"] is True
 
 
-def test_engine_pmr_matches_prototype_for_seeded_audit_verdicts(tmp_path: Path) -> None:
-    _require_pdf_engine()
-
+@pytest.mark.xdist_group(name="pmr_heavy")
+def test_engine_pmr_matches_prototype_for_seeded_audit_verdicts(engine, pmr_empty_css) -> None:
+    css = pmr_empty_css
     html = _write(
-        tmp_path / "doc.html",
+        css.parent / "parity.html",
         (
             "<!doctype html><html lang='en-US'><head><title>Parity PMR</title></head><body><main>"
             "<table><tr><th>Name</th><td>A</td></tr></table>"
@@ -285,45 +319,45 @@ def test_engine_pmr_matches_prototype_for_seeded_audit_verdicts(tmp_path: Path)
             "</main></body></html>"
         ),
     )
-    css = _write(tmp_path / "doc.css", "body{}")
-    engine = fullbleed.PdfEngine(document_lang="en-US", document_title="Parity PMR")
-
-    engine_report = engine.verify_paged_media_rank_artifacts(
-        str(html),
-        str(css),
-        profile="cav",
-        mode="error",
-        overflow_count=0,
-        known_loss_count=0,
-        source_page_count=1,
-        render_page_count=1,
-        review_queue_items=2,
-        pagination_trace_summary={"page_count": 1, "overflow_event_count": 0},
-    )
-    proto_report = prototype_verify_paged_media_rank(
-        html_path=html,
-        css_path=css,
-        profile="cav",
-        mode="error",
-        component_validation={"overflow_count": 0, "known_loss_count": 0},
-        parity_report={"coverage": {"review_queue_items": 2}, "source_characteristics": {"page_count": 1}},
-        run_report={"metrics": {"source_page_count": 1, "render_page_count": 1}},
-        pagination_trace_summary={"page_count": 1, "overflow_event_count": 0},
-        expected_lang="en-US",
-        expected_title="Parity PMR",
-        generated_at="2026-02-24T00:00:00Z",
-    )
-
-    def _verdicts(report: dict) -> dict[str, list[str]]:
-        out: dict[str, list[str]] = {}
-        for audit in report["audits"]:
-            out.setdefault(audit["audit_id"], []).append(audit["verdict"])
-        return out
+    engine.document_lang = "en-US"
+    engine.document_title = "Parity PMR"
+
+    # The native verifier releases the GIL, so the pure-Python prototype can run alongside it.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        engine_future = pool.submit(
+            engine.verify_paged_media_rank_artifacts,
+            str(html),
+            str(css),
+            profile="cav",
+            mode="error",
+            overflow_count=0,
+            known_loss_count=0,
+            source_page_count=1,
+            render_page_count=1,
+            review_queue_items=2,
+            pagination_trace_summary={"page_count": 1, "overflow_event_count": 0},
+        )
+        proto_future = pool.submit(
+            prototype_verify_paged_media_rank,
+            html_path=html,
+            css_path=css,
+            profile="cav",
+            mode="error",
+            component_validation={"overflow_count": 0, "known_loss_count": 0},
+            parity_report={"coverage": {"review_queue_items": 2}, "source_characteristics": {"page_count": 1}},
+            run_report={"metrics": {"source_page_count": 1, "render_page_count": 1}},
+            pagination_trace_summary={"page_count": 1, "overflow_event_count": 0},
+            expected_lang="en-US",
+            expected_title="Parity PMR",
+            generated_at="2026-02-24T00:00:00Z",
+        )
+        engine_report = engine_future.result()
+        proto_report = proto_future.result()
 
     assert _verdicts(engine_report) == _verdicts(proto_report)
     assert engine_report["gate"]["ok"] == proto_report["gate"]["ok"]
     assert engine_report["gate"]["failed_audit_ids"] == proto_report["gate"]["failed_audit_ids"]
-    assert engine_report["rank"]["score"] == pytest.approx(proto_report["rank"]["score"])
+    assert _centipoints(engine_report["rank"]["score"]) == _centipoints(proto_report["rank"]["score"])
     assert engine_report["observability"]["verdict_counts"] == proto_report["observability"]["verdict_counts"]
     assert engine_report["observability"]["category_counts"] == proto_report["observability"]["category_counts"]
     assert {
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import warnings
-
 import pytest
 
 from fullbleed.ui import Document, el, mount_component_html, render_node
@@ -111,12 +109,10 @@ def test_to_html_raise_mode_fails_on_missing_image_alt() -> None:
         artifact.to_html(a11y_mode="raise")
 
 
-def test_mount_component_html_warn_mode_emits_warnings_and_returns_html() -> None:
+def test_mount_component_html_warn_mode_emits_warnings_and_returns_html(caught_warnings) -> None:
     def app() -> object:
         return Region("Unlabeled region", role="region")
 
-    with warnings.catch_warnings(record=True) as caught:
-        warnings.simplefilter("always")
-        html = mount_component_html(app, a11y_mode="warn")
+    html = mount_component_html(app, a11y_mode="warn")
     assert "<html" in html
-    assert any(isinstance(w.message, A11yWarning) for w in caught)
+    assert any(isinstance(w.message, A11yWarning) for w in caught_warnings)
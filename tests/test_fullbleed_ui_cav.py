@@ -1,80 +1,109 @@
 from __future__ import annotations
 
+import types
+from typing import Any, Mapping
+
 import pytest
 
 from fullbleed.ui import cav
+from fullbleed.ui.cav import cav_profiles
+
+
+_EMPTY_CE = types.MappingProxyType({})
+# Placeholder values shared by the hoisted payloads below.
+_BLANK = "[Blank on form]"
+_BLANK_SHORT = "[Blank]"
+
+# Kit/HTML caches are per-process memo tables over read-only inputs, so render cases stay
+# independent under pytest-xdist (-n auto) and need no xdist_group pinning.
+_KIT_CACHE: dict[tuple[type, cav.CavProfile], cav.CavKitBase] = {}
+
+
+def _kit(cls: type, profile: cav.CavProfile) -> cav.CavKitBase:
+    # Kits are stateless across render() calls, so one instance per (kit, profile) serves every test.
+    key = (cls, profile)
+    kit = _KIT_CACHE.get(key)
+    if kit is None:
+        kit = _KIT_CACHE[key] = cls(profile=profile)
+    return kit
+
+
+_HTML_CACHE: dict[tuple[type, cav.CavProfile, int], str] = {}
+
+
+def _render_html(cls: type, profile: cav.CavProfile, payload: Mapping[str, Any]) -> str:
+    # Keyed on id(payload): render payloads are module constants that live as long as the cache.
+    key = (cls, profile, id(payload))
+    html = _HTML_CACHE.get(key)
+    if html is None:
+        html = _HTML_CACHE[key] = _kit(cls, profile).render(payload=payload, claim_evidence=_EMPTY_CE).root.to_html()
+    return html
+
+
+_EXPECTED_EXPORTS = frozenset(
+    {
+        "AgencyLetterCavKit",
+        "CourtMotionFormCavKit",
+        "DeclarationFormCavKit",
+        "InstructionSheetCavKit",
+        "InvestmentPortfolioReportCavKit",
+        "MarriageRecordCavKit",
+        "RecordedPlatCavKit",
+        "RequestRedactionFormCavKit",
+        "WarrantyDeedCavKit",
+        "cav_profiles",
+    }
+)
 
 
 def test_public_cav_surface_exports_family_kits_and_profiles_namespace() -> None:
-    assert hasattr(cav, "AgencyLetterCavKit")
-    assert hasattr(cav, "CourtMotionFormCavKit")
-    assert hasattr(cav, "DeclarationFormCavKit")
-    assert hasattr(cav, "InstructionSheetCavKit")
-    assert hasattr(cav, "InvestmentPortfolioReportCavKit")
-    assert hasattr(cav, "MarriageRecordCavKit")
-    assert hasattr(cav, "RecordedPlatCavKit")
-    assert hasattr(cav, "RequestRedactionFormCavKit")
-    assert hasattr(cav, "WarrantyDeedCavKit")
-    assert hasattr(cav, "cav_profiles")
+    missing = _EXPECTED_EXPORTS - vars(cav).keys()
+    assert not missing, sorted(missing)
+
+
+_EXPECTED_FAMILY: tuple[tuple[str, str], ...] = (
+    ("fl.escambia.marriage_record.rev2019", "marriage_record_cav"),
+    ("fl.escambia.agency_notice_letter.single_page_clerk_letterhead_notice.v1", "agency_letter_cav"),
+    ("fl.escambia.agency_notice.public_notice_vab_rescheduled_2020.v1", "agency_letter_cav"),
+    ("fl.escambia.declaration_form.cdc_eviction_2020_layout.v1", "declaration_form_cav"),
+    (
+        "fl.escambia.court_motion_form.child_support_telephone_hearing_title_iv_d_2019.v1",
+        "court_motion_form_cav",
+    ),
+    ("fl.escambia.court_motion_form.clerk_discharge_forfeiture_fs903_26_8_2020.v1", "court_motion_form_cav"),
+    ("fl.escambia.instruction_sheet.child_support_phone_testimony_2019.v1", "instruction_sheet_cav"),
+    (
+        "fl.state.family_law_instruction_packet.form12_961_notice_hearing_contempt_support_2018.v1",
+        "instruction_sheet_cav",
+    ),
+    (
+        "fl.state.family_law_instruction_packet.form12_921_notice_hearing_child_support_enforcement_2018.v1",
+        "instruction_sheet_cav",
+    ),
+    ("fl.escambia.investment_portfolio_summary.fy2019_2020.nov2019.v1", "investment_portfolio_report_cav"),
+    ("fl.escambia.request_redaction_exempt_personal_information.effective_2025.v1", "request_redaction_form_cav"),
+    ("fl.escambia.recorded_plat.legacy_side_certificate_layout.v1", "recorded_plat_cav"),
+)
 
 
 def test_profile_registry_supports_lookup_and_family_filtering() -> None:
-    p = cav.cav_profiles.REGISTRY.by_id("fl.escambia.marriage_record.rev2019")
-    assert p.family_id == "marriage_record_cav"
-    ids = cav.cav_profiles.REGISTRY.list_ids(family_id="marriage_record_cav")
+    registry = cav_profiles.REGISTRY
+    for profile_id, family_id in _EXPECTED_FAMILY:
+        assert registry.by_id(profile_id).family_id == family_id, profile_id
+    ids = registry.list_ids(family_id="marriage_record_cav")
     assert "fl.escambia.marriage_record.rev2019" in ids
     assert "fl.escambia.warranty_deed.rev1994" not in ids
-    letter = cav.cav_profiles.REGISTRY.by_id(
-        "fl.escambia.agency_notice_letter.single_page_clerk_letterhead_notice.v1"
-    )
-    assert letter.family_id == "agency_letter_cav"
-    public_notice = cav.cav_profiles.REGISTRY.by_id(
-        "fl.escambia.agency_notice.public_notice_vab_rescheduled_2020.v1"
-    )
-    assert public_notice.family_id == "agency_letter_cav"
-    decl = cav.cav_profiles.REGISTRY.by_id("fl.escambia.declaration_form.cdc_eviction_2020_layout.v1")
-    assert decl.family_id == "declaration_form_cav"
-    motion = cav.cav_profiles.REGISTRY.by_id(
-        "fl.escambia.court_motion_form.child_support_telephone_hearing_title_iv_d_2019.v1"
-    )
-    assert motion.family_id == "court_motion_form_cav"
-    forfeiture = cav.cav_profiles.REGISTRY.by_id(
-        "fl.escambia.court_motion_form.clerk_discharge_forfeiture_fs903_26_8_2020.v1"
-    )
-    assert forfeiture.family_id == "court_motion_form_cav"
-    instr = cav.cav_profiles.REGISTRY.by_id(
-        "fl.escambia.instruction_sheet.child_support_phone_testimony_2019.v1"
-    )
-    assert instr.family_id == "instruction_sheet_cav"
-    packet = cav.cav_profiles.REGISTRY.by_id(
-        "fl.state.family_law_instruction_packet.form12_961_notice_hearing_contempt_support_2018.v1"
-    )
-    assert packet.family_id == "instruction_sheet_cav"
-    packet_12921 = cav.cav_profiles.REGISTRY.by_id(
-        "fl.state.family_law_instruction_packet.form12_921_notice_hearing_child_support_enforcement_2018.v1"
-    )
-    assert packet_12921.family_id == "instruction_sheet_cav"
-    investment = cav.cav_profiles.REGISTRY.by_id(
-        "fl.escambia.investment_portfolio_summary.fy2019_2020.nov2019.v1"
-    )
-    assert investment.family_id == "investment_portfolio_report_cav"
-    redaction = cav.cav_profiles.REGISTRY.by_id(
-        "fl.escambia.request_redaction_exempt_personal_information.effective_2025.v1"
-    )
-    assert redaction.family_id == "request_redaction_form_cav"
-    plat = cav.cav_profiles.REGISTRY.by_id("fl.escambia.recorded_plat.legacy_side_certificate_layout.v1")
-    assert plat.family_id == "recorded_plat_cav"
 
 
 def test_family_kit_rejects_mismatched_profile_family() -> None:
-    with pytest.raises(ValueError):
-        cav.MarriageRecordCavKit(profile=cav.cav_profiles.FL_ESCAMBIA_WARRANTY_DEED_REV1994)
-    with pytest.raises(ValueError):
-        cav.AgencyLetterCavKit(profile=cav.cav_profiles.FL_ESCAMBIA_WARRANTY_DEED_REV1994)
+    with pytest.raises(ValueError, match="profile family mismatch"):
+        cav.MarriageRecordCavKit(profile=cav_profiles.FL_ESCAMBIA_WARRANTY_DEED_REV1994)
+    with pytest.raises(ValueError, match="profile family mismatch"):
+        cav.AgencyLetterCavKit(profile=cav_profiles.FL_ESCAMBIA_WARRANTY_DEED_REV1994)
 
 
 def test_family_kit_scope_validation_reports_unmapped_fields() -> None:
-    kit = cav.WarrantyDeedCavKit(profile=cav.cav_profiles.FL_ESCAMBIA_WARRANTY_DEED_REV1994)
+    kit = _kit(cav.WarrantyDeedCavKit, cav_profiles.FL_ESCAMBIA_WARRANTY_DEED_REV1994)
     report = kit.validate_payload_scope({"page1": {}, "unexpected_field": 1})
     assert report["ok"] is False
     assert report["issues"]
@@ -85,14 +114,13 @@ def test_family_kit_scope_validation_reports_unmapped_fields() -> None:
 
 
 def test_family_kit_render_shape_is_props_first_and_scope_checked_before_render() -> None:
-    kit = cav.MarriageRecordCavKit(profile=cav.cav_profiles.FL_ESCAMBIA_MARRIAGE_RECORD_REV2019)
-    with pytest.raises(ValueError):
+    kit = _kit(cav.MarriageRecordCavKit, cav_profiles.FL_ESCAMBIA_MARRIAGE_RECORD_REV2019)
+    with pytest.raises(ValueError, match="CAVKIT_PROFILE_UNMAPPED_PAYLOAD_FIELD"):
         kit.render(payload={"unexpected": 1}, claim_evidence={"profile": {}})
 
 
-def test_warranty_deed_family_kit_renders_document_artifact() -> None:
-    kit = cav.WarrantyDeedCavKit(profile=cav.cav_profiles.FL_ESCAMBIA_WARRANTY_DEED_REV1994)
-    payload = {
+_WARRANTY_DEED_PAYLOAD = types.MappingProxyType(
+    {
         "title": "This Warranty Deed",
         "header": {
             "instrument_book_page": "OR Bk0000 Pg0000",
@@ -175,17 +203,11 @@ def test_warranty_deed_family_kit_renders_document_artifact() -> None:
         "metadata": {},
         "source_pdf": None,
     }
-    artifact = kit.render(payload=payload, claim_evidence={})
-    html = artifact.root.to_html()
-    assert "This Warranty Deed" in html
-    assert "Schedule A" in html
+)
 
 
-def test_recorded_plat_family_kit_renders_document_artifact() -> None:
-    kit = cav.RecordedPlatCavKit(
-        profile=cav.cav_profiles.FL_ESCAMBIA_RECORDED_PLAT_LEGACY_SIDE_CERTIFICATE_LAYOUT_V1
-    )
-    payload = {
+_RECORDED_PLAT_PAYLOAD = types.MappingProxyType(
+    {
         "schema": "fullbleed.cav.plat.v1",
         "document_kind": "recorded_plat",
         "title": "RENZ-ANNA VILLA",
@@ -220,17 +242,11 @@ def test_recorded_plat_family_kit_renders_document_artifact() -> None:
         "metadata": {},
         "source_pdf": None,
     }
-    artifact = kit.render(payload=payload, claim_evidence={})
-    html = artifact.root.to_html()
-    assert "RENZ-ANNA VILLA" in html
-    assert "Recorded Plat Map" in html
+)
 
 
-def test_declaration_form_family_kit_renders_document_artifact() -> None:
-    kit = cav.DeclarationFormCavKit(
-        profile=cav.cav_profiles.FL_ESCAMBIA_DECLARATION_FORM_CDC_EVICTION_2020_LAYOUT_V1
-    )
-    payload = {
+_DECLARATION_FORM_PAYLOAD = types.MappingProxyType(
+    {
         "schema": "fullbleed.cav.declaration.v1",
         "document_kind": "declaration_form",
         "title": "DECLARATION UNDER PENALTY OF PERJURY",
@@ -244,38 +260,32 @@ def test_declaration_form_family_kit_renders_document_artifact() -> None:
             "signature_status": "signature_line_only",
             "signature_method": "signature_line_only",
             "signature_ref": "decl-sig",
-            "date": "[Blank on form]",
-            "print_name": "[Blank on form]",
-            "phone": "[Blank on form]",
-            "email": "[Blank on form]",
-            "address": "[Blank on form]",
+            "date": _BLANK,
+            "print_name": _BLANK,
+            "phone": _BLANK,
+            "email": _BLANK,
+            "address": _BLANK,
         },
         "authority_footer": ["Authority: ...", "Dated: September 1, 2020."],
         "review_queue": [],
         "metadata": {},
         "source_pdf": None,
     }
-    artifact = kit.render(payload=payload, claim_evidence={})
-    html = artifact.root.to_html()
-    assert "DECLARATION UNDER PENALTY OF PERJURY" in html
-    assert "Declarant Signature and Contact" in html
+)
 
 
-def test_court_motion_form_family_kit_renders_document_artifact() -> None:
-    kit = cav.CourtMotionFormCavKit(
-        profile=cav.cav_profiles.FL_ESCAMBIA_COURT_MOTION_FORM_CHILD_SUPPORT_TELEPHONE_HEARING_TITLE_IV_D_2019_V1
-    )
-    payload = {
+_COURT_MOTION_TELEPHONE_PAYLOAD = types.MappingProxyType(
+    {
         "schema": "fullbleed.cav.court_motion_form.v1",
         "document_kind": "court_motion_form",
         "header_note": "Updated 6/2019 by Child Support Hearing Officer",
         "court_caption": {
             "court_line": "IN THE CIRCUIT COURT IN AND FOR ESCAMBIA COUNTY, FLORIDA",
             "division_line": "FAMILY LAW DIVISION",
-            "petitioner": "[Blank on form]",
-            "respondent": "[Blank on form]",
-            "case_number": "[Blank on form]",
-            "division_case_code": "[Blank on form]",
+            "petitioner": _BLANK,
+            "respondent": _BLANK,
+            "case_number": _BLANK,
+            "division_case_code": _BLANK,
         },
         "motion_title_lines": [
             "MOTION FOR AUTHORITY TO PARTICIPATE/TESTIFY BY TELEPHONE",
@@ -291,26 +301,20 @@ def test_court_motion_form_family_kit_renders_document_artifact() -> None:
             "signature_status": "unknown",
             "signature_method": "signature_line_only",
             "signature_ref": "motion-sig",
-            "dated": "[Blank on form]",
-            "printed_name": "[Blank on form]",
-            "address": "[Blank on form]",
-            "city_state_zip": "[Blank on form]",
-            "telephone_fax": "[Blank on form]",
-            "email": "[Blank on form]",
+            "dated": _BLANK,
+            "printed_name": _BLANK,
+            "address": _BLANK,
+            "city_state_zip": _BLANK,
+            "telephone_fax": _BLANK,
+            "email": _BLANK,
         },
         "metadata": {},
     }
-    artifact = kit.render(payload=payload, claim_evidence={})
-    html = artifact.root.to_html()
-    assert "MOTION FOR AUTHORITY TO PARTICIPATE/TESTIFY BY TELEPHONE" in html
-    assert "Court Caption" in html
+)
 
 
-def test_court_motion_form_supports_forfeiture_shape_extensions() -> None:
-    kit = cav.CourtMotionFormCavKit(
-        profile=cav.cav_profiles.FL_ESCAMBIA_COURT_MOTION_FORM_CLERK_DISCHARGE_FORFEITURE_FS903_26_8_2020_V1
-    )
-    payload = {
+_COURT_MOTION_FORFEITURE_PAYLOAD = types.MappingProxyType(
+    {
         "schema": "fullbleed.cav.court_motion_form.v1",
         "document_kind": "court_motion_form",
         "header_note": "Revised 07/27/2020",
@@ -320,8 +324,8 @@ def test_court_motion_form_supports_forfeiture_shape_extensions() -> None:
             "division_line": "STATE OF FLORIDA",
             "petitioner": "STATE OF FLORIDA",
             "respondent": "[Blank on form] / Defendant",
-            "case_number": "[Blank on form]",
-            "division_case_code": "[Blank on form]",
+            "case_number": _BLANK,
+            "division_case_code": _BLANK,
         },
         "motion_title_lines": [
             "APPLICATION FOR CLERK'S DISCHARGE OF FORFEITURE",
@@ -330,7 +334,7 @@ def test_court_motion_form_supports_forfeiture_shape_extensions() -> None:
         "opening_statement": "1. I, [Blank on form], the bail bond agent, posted the following bond(s).",
         "bond_rows_heading": "Bond(s) Posted",
         "bond_rows": [
-            {"label": "Bond 1", "charge": "[Blank]", "amount": "[Blank]", "bond_power_no": "[Blank]"},
+            {"label": "Bond 1", "charge": _BLANK_SHORT, "amount": _BLANK_SHORT, "bond_power_no": _BLANK_SHORT},
         ],
         "grounds_heading": "Statutory Basis",
         "grounds_intro": "6. The forfeiture should be discharged because (check the appropriate box):",
@@ -348,28 +352,20 @@ def test_court_motion_form_supports_forfeiture_shape_extensions() -> None:
             "signature_status": "missing",
             "signature_method": "signature_line_only",
             "signature_ref": "doc728-signature",
-            "dated": "[Blank on form]",
-            "printed_name": "[Blank on form]",
-            "address": "[Blank on form]",
-            "city_state_zip": "[Blank on form]",
-            "telephone_fax": "[Blank on form]",
-            "email": "[Blank on form]",
+            "dated": _BLANK,
+            "printed_name": _BLANK,
+            "address": _BLANK,
+            "city_state_zip": _BLANK,
+            "telephone_fax": _BLANK,
+            "email": _BLANK,
         },
         "metadata": {},
     }
-    artifact = kit.render(payload=payload, claim_evidence={})
-    html = artifact.root.to_html()
-    assert "APPLICATION FOR CLERK" in html
-    assert "DISCHARGE OF FORFEITURE" in html
-    assert "Bond(s) Posted" in html
-    assert "page-break-before" in html
-
-
-def test_agency_letter_family_kit_renders_document_artifact() -> None:
-    kit = cav.AgencyLetterCavKit(
-        profile=cav.cav_profiles.FL_ESCAMBIA_AGENCY_NOTICE_LETTER_SINGLE_PAGE_CLERK_LETTERHEAD_2021_V1
-    )
-    payload = {
+)
+
+
+_AGENCY_LETTER_PAYLOAD = types.MappingProxyType(
+    {
         "schema": "fullbleed.cav.agency_letter.v1",
         "document_kind": "agency_notice_letter",
         "title": "Tourist Development Tax (TDT) increases to 5%, effective April 2021",
@@ -406,17 +402,11 @@ def test_agency_letter_family_kit_renders_document_artifact() -> None:
         "metadata": {},
         "source_pdf": None,
     }
-    artifact = kit.render(payload=payload, claim_evidence={})
-    html = artifact.root.to_html()
-    assert "Tourist Development Tax (TDT) increases to 5%" in html
-    assert "Escambia County Ordinance Sec. 90-65" in html
+)
 
 
-def test_agency_letter_family_kit_supports_notice_without_letterhead() -> None:
-    kit = cav.AgencyLetterCavKit(
-        profile=cav.cav_profiles.FL_ESCAMBIA_AGENCY_NOTICE_PUBLIC_NOTICE_VAB_RESCHEDULED_2020_V1
-    )
-    payload = {
+_AGENCY_PUBLIC_NOTICE_PAYLOAD = types.MappingProxyType(
+    {
         "schema": "fullbleed.cav.agency_letter.v1",
         "document_kind": "agency_notice_letter",
         "show_letterhead": False,
@@ -430,18 +420,11 @@ def test_agency_letter_family_kit_supports_notice_without_letterhead() -> None:
         "metadata": {},
         "source_pdf": None,
     }
-    artifact = kit.render(payload=payload, claim_evidence={})
-    html = artifact.root.to_html()
-    assert "PUBLIC NOTICE" in html
-    assert "Value Adjustment Board" in html
-    assert "letterhead-card" not in html
-
-
-def test_instruction_sheet_family_kit_renders_document_artifact() -> None:
-    kit = cav.InstructionSheetCavKit(
-        profile=cav.cav_profiles.FL_ESCAMBIA_INSTRUCTION_SHEET_CHILD_SUPPORT_PHONE_TESTIMONY_2019_V1
-    )
-    payload = {
+)
+
+
+_INSTRUCTION_SHEET_PAYLOAD = types.MappingProxyType(
+    {
         "schema": "fullbleed.cav.instruction_sheet.v1",
         "document_kind": "instruction_sheet",
         "header_note": "Updated 6/2019 by Child Support Hearing Officer",
@@ -464,17 +447,11 @@ def test_instruction_sheet_family_kit_renders_document_artifact() -> None:
         "metadata": {},
         "source_pdf": None,
     }
-    artifact = kit.render(payload=payload, claim_evidence={})
-    html = artifact.root.to_html()
-    assert "CHILD SUPPORT CASE HEARING" in html
-    assert "Escambia County" in html
+)
 
 
-def test_instruction_sheet_family_kit_renders_paginated_instruction_packet() -> None:
-    kit = cav.InstructionSheetCavKit(
-        profile=cav.cav_profiles.FL_STATE_FAMILY_LAW_INSTRUCTION_PACKET_FORM_12_961_2018_V1
-    )
-    payload = {
+_INSTRUCTION_PACKET_PAYLOAD = types.MappingProxyType(
+    {
         "schema": "fullbleed.cav.instruction_sheet.v1",
         "document_kind": "instruction_sheet",
         "header_note": "Florida Supreme Court Approved Family Law Form 12.961 (09/18)",
@@ -507,17 +484,11 @@ def test_instruction_sheet_family_kit_renders_paginated_instruction_packet() ->
         "metadata": {},
         "source_pdf": None,
     }
-    artifact = kit.render(payload=payload, claim_evidence={})
-    html = artifact.root.to_html()
-    assert "INSTRUCTIONS FOR FLORIDA SUPREME COURT APPROVED FAMILY LAW FORM 12.961" in html
-    assert "instruction-page-break" in html
+)
 
 
-def test_investment_portfolio_report_family_kit_renders_document_artifact() -> None:
-    kit = cav.InvestmentPortfolioReportCavKit(
-        profile=cav.cav_profiles.FL_ESCAMBIA_INVESTMENT_PORTFOLIO_SUMMARY_FY2019_2020_NOV2019_V1
-    )
-    payload = {
+_INVESTMENT_PORTFOLIO_PAYLOAD = types.MappingProxyType(
+    {
         "schema": "fullbleed.cav.investment_portfolio_report.v1",
         "document_kind": "investment_portfolio_report",
         "cover_page": {
@@ -555,17 +526,11 @@ def test_investment_portfolio_report_family_kit_renders_document_artifact() -> N
         "metadata": {},
         "source_pdf": None,
     }
-    artifact = kit.render(payload=payload, claim_evidence={})
-    html = artifact.root.to_html()
-    assert "INVESTMENT PORTFOLIO SUMMARY REPORT" in html
-    assert "Summary of Investment Allocation" in html
+)
 
 
-def test_request_redaction_form_family_kit_renders_document_artifact() -> None:
-    kit = cav.RequestRedactionFormCavKit(
-        profile=cav.cav_profiles.FL_ESCAMBIA_REQUEST_REDACTION_EXEMPT_PERSONAL_INFORMATION_EFFECTIVE_2025_V1
-    )
-    payload = {
+_REDACTION_REQUEST_PAYLOAD = types.MappingProxyType(
+    {
         "schema": "fullbleed.cav.request_redaction_form.v1",
         "document_kind": "request_redaction_form",
         "title_lines": [
@@ -586,19 +551,19 @@ def test_request_redaction_form_family_kit_renders_document_artifact() -> None:
         ],
         "category_note": "Grantor, grantee, or party names cannot be removed unless they contain the street address.",
         "requestor_contact": {
-            "printed_name": "[Blank on form]",
-            "telephone": "[Blank on form]",
-            "email": "[Blank on form]",
+            "printed_name": _BLANK,
+            "telephone": _BLANK,
+            "email": _BLANK,
         },
         "information_to_be_redacted": {
-            "residence_address": "[Blank on form]",
-            "additional_address_descriptions": "[Blank on form]",
-            "telephone_numbers": "[Blank on form]",
-            "ssn_dob": "[Blank on form]",
-            "spouse_children_names": "[Blank on form]",
-            "employment_location": "[Blank on form]",
-            "school_daycare_location": "[Blank on form]",
-            "personal_assets": "[Blank on form]",
+            "residence_address": _BLANK,
+            "additional_address_descriptions": _BLANK,
+            "telephone_numbers": _BLANK,
+            "ssn_dob": _BLANK,
+            "spouse_children_names": _BLANK,
+            "employment_location": _BLANK,
+            "school_daycare_location": _BLANK,
+            "personal_assets": _BLANK,
         },
         "warning_paragraphs": [
             "WARNING: There may be consequences to redacting information on a public record.",
@@ -609,13 +574,13 @@ def test_request_redaction_form_family_kit_renders_document_artifact() -> None:
         ],
         "documents_table_rows": [
             {
-                "instrument_number": "[Blank]",
-                "book": "[Blank]",
-                "page": "[Blank]",
-                "document_title": "[Blank]",
+                "instrument_number": _BLANK_SHORT,
+                "book": _BLANK_SHORT,
+                "page": _BLANK_SHORT,
+                "document_title": _BLANK_SHORT,
             }
         ],
-        "documents_other_line": "[Blank on form]",
+        "documents_other_line": _BLANK,
         "release_to_government_paragraphs": [
             "RELEASE TO GOVERNMENTAL AGENCIES: An unredacted version of these documents will be provided as required.",
         ],
@@ -628,10 +593,10 @@ def test_request_redaction_form_family_kit_renders_document_artifact() -> None:
         "notary_block": {
             "state": "FLORIDA",
             "county": "ESCAMBIA",
-            "sworn_statement": "[Blank on form]",
-            "identity_line": "[Blank on form]",
-            "notary_signature_line": "[Blank on form]",
-            "notary_print_name": "[Blank on form]",
+            "sworn_statement": _BLANK,
+            "identity_line": _BLANK,
+            "notary_signature_line": _BLANK,
+            "notary_print_name": _BLANK,
         },
         "signature_block": {
             "signature_status": "missing",
@@ -643,7 +608,111 @@ def test_request_redaction_form_family_kit_renders_document_artifact() -> None:
         "metadata": {},
         "source_pdf": None,
     }
-    artifact = kit.render(payload=payload, claim_evidence={})
-    html = artifact.root.to_html()
-    assert "REQUEST FOR REDACTION OF EXEMPT PERSONAL INFORMATION" in html
-    assert "Documents to be redacted" in html
+)
+
+
+_RENDER_CASES = [
+    pytest.param(
+        cav.WarrantyDeedCavKit,
+        cav_profiles.FL_ESCAMBIA_WARRANTY_DEED_REV1994,
+        _WARRANTY_DEED_PAYLOAD,
+        ("This Warranty Deed", "Schedule A"),
+        (),
+        id="warranty_deed",
+    ),
+    pytest.param(
+        cav.RecordedPlatCavKit,
+        cav_profiles.FL_ESCAMBIA_RECORDED_PLAT_LEGACY_SIDE_CERTIFICATE_LAYOUT_V1,
+        _RECORDED_PLAT_PAYLOAD,
+        ("RENZ-ANNA VILLA", "Recorded Plat Map"),
+        (),
+        id="recorded_plat",
+    ),
+    pytest.param(
+        cav.DeclarationFormCavKit,
+        cav_profiles.FL_ESCAMBIA_DECLARATION_FORM_CDC_EVICTION_2020_LAYOUT_V1,
+        _DECLARATION_FORM_PAYLOAD,
+        ("DECLARATION UNDER PENALTY OF PERJURY", "Declarant Signature and Contact"),
+        (),
+        id="declaration_form",
+    ),
+    pytest.param(
+        cav.CourtMotionFormCavKit,
+        cav_profiles.FL_ESCAMBIA_COURT_MOTION_FORM_CHILD_SUPPORT_TELEPHONE_HEARING_TITLE_IV_D_2019_V1,
+        _COURT_MOTION_TELEPHONE_PAYLOAD,
+        ("MOTION FOR AUTHORITY TO PARTICIPATE/TESTIFY BY TELEPHONE", "Court Caption"),
+        (),
+        id="court_motion_form",
+    ),
+    pytest.param(
+        cav.CourtMotionFormCavKit,
+        cav_profiles.FL_ESCAMBIA_COURT_MOTION_FORM_CLERK_DISCHARGE_FORFEITURE_FS903_26_8_2020_V1,
+        _COURT_MOTION_FORFEITURE_PAYLOAD,
+        ("APPLICATION FOR CLERK", "DISCHARGE OF FORFEITURE", "Bond(s) Posted", "page-break-before"),
+        (),
+        id="court_motion_form_forfeiture",
+    ),
+    pytest.param(
+        cav.AgencyLetterCavKit,
+        cav_profiles.FL_ESCAMBIA_AGENCY_NOTICE_LETTER_SINGLE_PAGE_CLERK_LETTERHEAD_2021_V1,
+        _AGENCY_LETTER_PAYLOAD,
+        ("Tourist Development Tax (TDT) increases to 5%", "Escambia County Ordinance Sec. 90-65"),
+        (),
+        id="agency_letter",
+    ),
+    pytest.param(
+        cav.AgencyLetterCavKit,
+        cav_profiles.FL_ESCAMBIA_AGENCY_NOTICE_PUBLIC_NOTICE_VAB_RESCHEDULED_2020_V1,
+        _AGENCY_PUBLIC_NOTICE_PAYLOAD,
+        ("PUBLIC NOTICE", "Value Adjustment Board"),
+        ("letterhead-card",),
+        id="agency_notice_without_letterhead",
+    ),
+    pytest.param(
+        cav.InstructionSheetCavKit,
+        cav_profiles.FL_ESCAMBIA_INSTRUCTION_SHEET_CHILD_SUPPORT_PHONE_TESTIMONY_2019_V1,
+        _INSTRUCTION_SHEET_PAYLOAD,
+        ("CHILD SUPPORT CASE HEARING", "Escambia County"),
+        (),
+        id="instruction_sheet",
+    ),
+    pytest.param(
+        cav.InstructionSheetCavKit,
+        cav_profiles.FL_STATE_FAMILY_LAW_INSTRUCTION_PACKET_FORM_12_961_2018_V1,
+        _INSTRUCTION_PACKET_PAYLOAD,
+        ("INSTRUCTIONS FOR FLORIDA SUPREME COURT APPROVED FAMILY LAW FORM 12.961", "instruction-page-break"),
+        (),
+        id="instruction_packet_paginated",
+    ),
+    pytest.param(
+        cav.InvestmentPortfolioReportCavKit,
+        cav_profiles.FL_ESCAMBIA_INVESTMENT_PORTFOLIO_SUMMARY_FY2019_2020_NOV2019_V1,
+        _INVESTMENT_PORTFOLIO_PAYLOAD,
+        ("INVESTMENT PORTFOLIO SUMMARY REPORT", "Summary of Investment Allocation"),
+        (),
+        id="investment_portfolio_report",
+    ),
+    pytest.param(
+        cav.RequestRedactionFormCavKit,
+        cav_profiles.FL_ESCAMBIA_REQUEST_REDACTION_EXEMPT_PERSONAL_INFORMATION_EFFECTIVE_2025_V1,
+        _REDACTION_REQUEST_PAYLOAD,
+        ("REQUEST FOR REDACTION OF EXEMPT PERSONAL INFORMATION", "Documents to be redacted"),
+        (),
+        id="request_redaction_form",
+    ),
+]
+
+
+@pytest.mark.parametrize("kit_cls, profile, payload, must_contain, must_not_contain", _RENDER_CASES)
+def test_family_kit_renders_document_artifact(
+    kit_cls: type,
+    profile: cav.CavProfile,
+    payload: Mapping[str, Any],
+    must_contain: tuple[str, ...],
+    must_not_contain: tuple[str, ...],
+    assert_contains_all,
+    assert_contains_none,
+) -> None:
+    html = _render_html(kit_cls, profile, payload)
+    assert_contains_all(html, must_contain)
+    assert_contains_none(html, must_not_contain)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib.util
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -21,6 +22,7 @@ FIXTURE_DIR = Path(__file__).parent / "fixtures" / "fullbleed_ui"
 ROOT = Path(__file__).resolve().parents[1]
 
 
+@lru_cache(maxsize=None)
 def _fixture(name: str) -> str:
     return (FIXTURE_DIR / name).read_text(encoding="utf-8")
 
@@ -68,8 +70,9 @@ def test_to_html_dispatches_for_element_and_document() -> None:
         return el("p", "x")
 
     artifact = app()
-    assert to_html(artifact) == compile_document(artifact)
-    assert artifact.to_html() == compile_document(artifact)
+    expected = compile_document(artifact)
+    assert to_html(artifact) == expected
+    assert artifact.to_html() == expected
     assert node.to_html() == "<div>hello</div>"
 
 
@@ -161,16 +164,20 @@ def test_document_css_required_raises_without_href(tmp_path: Path) -> None:
         artifact.emit_html(tmp_path / "doc.html")
 
 
-def test_scaffold_template_fb_ui_is_reexport_shim() -> None:
+@pytest.fixture(scope="session")
+def fb_ui_shim():
     shim_path = ROOT / "python" / "fullbleed_cli" / "scaffold_templates" / "init" / "components" / "fb_ui.py"
     spec = importlib.util.spec_from_file_location("fb_ui_shim_test", shim_path)
     assert spec is not None and spec.loader is not None
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
+    return module
 
+
+def test_scaffold_template_fb_ui_is_reexport_shim(fb_ui_shim) -> None:
     from fullbleed.ui import mount_component_html as package_mount_component_html
 
-    assert module.mount_component_html is package_mount_component_html
+    assert fb_ui_shim.mount_component_html is package_mount_component_html
 
 
 def test_validate_component_mount_fails_on_text_overlap_from_render_trace() -> None:
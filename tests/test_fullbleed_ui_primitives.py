@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 from fullbleed.ui import render_node
@@ -9,6 +10,7 @@ from fullbleed.ui.primitives import Spacer, Th
 FIXTURE_DIR = Path(__file__).parent / "fixtures" / "fullbleed_ui"
 
 
+@lru_cache(maxsize=None)
 def _fixture(name: str) -> str:
     return (FIXTURE_DIR / name).read_text(encoding="utf-8")
 
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import warnings
-
 from fullbleed.ui import el, render_node, style
 from fullbleed.ui.style import StyleWarning
 
@@ -24,9 +22,7 @@ def test_style_fragments_merge_last_write_wins_with_order() -> None:
     assert render_node(node) == '<div style="font-weight: 600; color: blue;">x</div>'
 
 
-def test_style_bool_value_warns_and_is_skipped() -> None:
-    with warnings.catch_warnings(record=True) as caught:
-        warnings.simplefilter("always")
-        css = style({"display": True, "color": "red"}).to_css()
+def test_style_bool_value_warns_and_is_skipped(caught_warnings) -> None:
+    css = style({"display": True, "color": "red"}).to_css()
     assert css == "color: red;"
-    assert any(isinstance(w.message, StyleWarning) for w in caught)
+    assert any(isinstance(w.message, StyleWarning) for w in caught_warnings)
@@ -12,8 +12,8 @@ def test_accessible_template_is_registered() -> None:
     assert tmpl["source_dir"] == "new/accessible"
 
 
-def test_accessible_template_tree_contains_expected_files() -> None:
-    files = scaffold._load_template_tree("new/accessible")
+def test_accessible_template_tree_contains_expected_files(scaffold_tree) -> None:
+    files = scaffold_tree("new/accessible")
     assert "README.md" in files
     assert "report.py" in files
     assert "styles/report.css" in files
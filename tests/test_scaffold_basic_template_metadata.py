@@ -6,8 +6,8 @@ from types import SimpleNamespace
 from fullbleed_cli import scaffold
 
 
-def test_invoice_template_tree_contains_report_with_css_metadata_defaults() -> None:
-    files = scaffold._load_template_tree("new/invoice")
+def test_invoice_template_tree_contains_report_with_css_metadata_defaults(scaffold_tree) -> None:
+    files = scaffold_tree("new/invoice")
     assert "report.py" in files
     assert "templates/invoice.html" in files
     assert "templates/invoice.css" in files
@@ -19,8 +19,8 @@ def test_invoice_template_tree_contains_report_with_css_metadata_defaults() -> N
     assert "emit_artifacts(" in files["report.py"]
 
 
-def test_statement_template_tree_contains_report_with_css_metadata_defaults() -> None:
-    files = scaffold._load_template_tree("new/statement")
+def test_statement_template_tree_contains_report_with_css_metadata_defaults(scaffold_tree) -> None:
+    files = scaffold_tree("new/statement")
     assert "report.py" in files
     assert "templates/statement.html" in files
     assert "templates/statement.css" in files
@@ -10,11 +10,15 @@ Exits with non-zero status when any row fails validation.
 from __future__ import annotations
 
 import argparse
+import http.client
 import json
 import sys
-import urllib.request
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Tuple
+from urllib.parse import urljoin, urlsplit
 
 
 ALLOWED_LICENSES = {"OFL-1.1", "Apache-2.0", "UFL-1.0", "MIT"}
@@ -24,22 +28,114 @@ LICENSE_MARKERS = {
     "UFL-1.0": ("ubuntu font licence", "ubuntu font license"),
     "MIT": ("mit license",),
 }
+# Markers are ASCII, so license payloads can be matched as lowercased bytes without decoding.
+LICENSE_MARKERS_BYTES = {
+    name: tuple(marker.encode("ascii") for marker in markers)
+    for name, markers in LICENSE_MARKERS.items()
+}
+DEFAULT_JOBS = 16
+FETCH_TIMEOUT = 25
+FETCH_LIMIT = 65536
+MAX_REDIRECTS = 5
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+_USER_AGENT = "fullbleed-font-license-audit"
+_MD_ROW = (
+    "| `{name}` | `{kind}` | `{version}` | `{license}` | "
+    "{font_url} | {license_url} | `{status}` |\n"
+)
+
+# Many assets share one canonical license URL (e.g. OFL-1.1); fetch each body once per run.
+_LICENSE_FETCH_CACHE: Dict[str, Tuple[bool, bytes]] = {}
+_LICENSE_FETCH_LOCKS: Dict[str, threading.Lock] = {}
+_LICENSE_FETCH_LOCKS_GUARD = threading.Lock()
+
+# Keep-alive connections are reused per (scheme, host) within each worker thread, so repeated
+# probes against one CDN skip the TCP/TLS handshake. http.client connections are not thread-safe.
+_CONNECTIONS = threading.local()
+
+
+def _connection(scheme: str, netloc: str) -> http.client.HTTPConnection:
+    pool = getattr(_CONNECTIONS, "pool", None)
+    if pool is None:
+        pool = _CONNECTIONS.pool = {}
+    conn = pool.get((scheme, netloc))
+    if conn is None:
+        factory = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = pool[(scheme, netloc)] = factory(netloc, timeout=FETCH_TIMEOUT)
+    return conn
+
+
+def _send(conn: http.client.HTTPConnection, method: str, target: str) -> http.client.HTTPResponse:
+    headers = {"User-Agent": _USER_AGENT}
+    try:
+        conn.request(method, target, headers=headers)
+        return conn.getresponse()
+    except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+        # The server dropped an idle keep-alive connection; retry once on a fresh socket.
+        conn.close()
+        conn.request(method, target, headers=headers)
+        return conn.getresponse()
+
+
+def _request(method: str, url: str, limit: int = FETCH_LIMIT) -> bytes:
+    """Issue method against url over a reused connection, following redirects."""
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"unsupported URL scheme: {url!r}")
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        conn = _connection(parts.scheme, parts.netloc)
+        try:
+            resp = _send(conn, method, target)
+            body = resp.read(limit)
+        except Exception:
+            conn.close()
+            raise
+        if not resp.isclosed():
+            # Unread body left on the socket (large font file); drop it rather than drain it.
+            conn.close()
+        location = resp.getheader("Location")
+        if resp.status in _REDIRECT_STATUSES and location:
+            url = urljoin(url, location)
+            continue
+        if resp.status >= 400:
+            raise http.client.HTTPException(f"HTTP {resp.status} for {url}")
+        return body
+    raise http.client.HTTPException(f"too many redirects for {url}")
 
 
 def _fetch_head_or_get(url: str) -> Tuple[bool, bytes]:
     """Check reachability and fetch a small payload."""
     try:
-        req = urllib.request.Request(url, method="HEAD")
-        with urllib.request.urlopen(req, timeout=25):
-            return True, b""
+        _request("HEAD", url)
+        return True, b""
     except Exception:
         try:
-            with urllib.request.urlopen(url, timeout=25) as resp:
-                return True, resp.read(65536)
+            return True, _request("GET", url)
         except Exception:
             return False, b""
 
 
+def _fetch_license(url: str) -> Tuple[bool, bytes]:
+    """Fetch a license body (GET fallback after a bare HEAD), memoized by URL."""
+    with _LICENSE_FETCH_LOCKS_GUARD:
+        lock = _LICENSE_FETCH_LOCKS.setdefault(url, threading.Lock())
+    with lock:
+        cached = _LICENSE_FETCH_CACHE.get(url)
+        if cached is not None:
+            return cached
+        ok, payload = _fetch_head_or_get(url)
+        if ok and not payload:
+            try:
+                payload = _request("GET", url)
+            except Exception:
+                payload = b""
+        result = _LICENSE_FETCH_CACHE[url] = (ok, payload)
+        return result
+
+
 def _load_remote_assets(repo_root: Path) -> Dict[str, Dict]:
     sys.path.insert(0, str((repo_root / "fullbleed_cli" / "src").resolve()))
     from fullbleed_cli import assets  # pylint: disable=import-error
@@ -52,20 +148,17 @@ def _validate_row(name: str, meta: Dict) -> Dict:
     font_url = str(meta.get("url", ""))
     license_url = str(meta.get("license_url", ""))
 
-    font_url_ok, _ = _fetch_head_or_get(font_url)
-    license_url_ok, license_payload = _fetch_head_or_get(license_url)
-
-    if license_url_ok and not license_payload:
-        try:
-            with urllib.request.urlopen(license_url, timeout=25) as resp:
-                license_payload = resp.read(65536)
-        except Exception:
-            license_payload = b""
-
     allowed_license = license_name in ALLOWED_LICENSES
-    markers = LICENSE_MARKERS.get(license_name, ())
-    text = license_payload.decode("utf-8", errors="ignore").lower()
-    license_text_ok = bool(markers) and any(marker in text for marker in markers)
+    if allowed_license:
+        font_url_ok, _ = _fetch_head_or_get(font_url)
+        license_url_ok, license_payload = _fetch_license(license_url)
+        markers = LICENSE_MARKERS_BYTES.get(license_name, ())
+        lowered = license_payload.lower()
+        license_text_ok = any(marker in lowered for marker in markers)
+    else:
+        # The row fails on allowed_license alone, so the network probes are skipped; "reason"
+        # tells these rows apart from ones whose URLs were probed and found unreachable.
+        font_url_ok = license_url_ok = license_text_ok = False
 
     ok = allowed_license and font_url_ok and license_url_ok and license_text_ok
     return {
@@ -79,24 +172,25 @@ def _validate_row(name: str, meta: Dict) -> Dict:
         "license_url": license_url,
         "license_url_ok": license_url_ok,
         "license_text_ok": license_text_ok,
+        "reason": None if allowed_license else "license_not_allowed",
         "status": "PASS" if ok else "FAIL",
     }
 
 
-def _write_reports(repo_root: Path, audit_date: str, rows: List[Dict], issues: List[Dict]) -> None:
+def _write_reports(repo_root: Path, audit_date: str, rows: List[Dict], issues: List[Dict]) -> Dict:
     summary = {
         "audit_date": audit_date,
         "remote_assets_count": len(rows),
         "allowed_license_set": sorted(ALLOWED_LICENSES),
-        "pass_count": sum(1 for row in rows if row["status"] == "PASS"),
-        "fail_count": sum(1 for row in rows if row["status"] == "FAIL"),
+        # Every non-PASS row produces exactly one issue entry.
+        "pass_count": len(rows) - len(issues),
+        "fail_count": len(issues),
     }
     payload = {"summary": summary, "rows": rows, "issues": issues}
-    (repo_root / "FONT_LICENSE_AUDIT.json").write_text(
-        json.dumps(payload, ensure_ascii=True, indent=2), encoding="utf-8"
-    )
+    with (repo_root / "FONT_LICENSE_AUDIT.json").open("w", encoding="utf-8") as fh:
+        json.dump(payload, fh, ensure_ascii=True, indent=2)
 
-    lines = [
+    header = [
         "# Font License Audit",
         "",
         f"Audit date: {audit_date}",
@@ -117,26 +211,31 @@ def _write_reports(repo_root: Path, audit_date: str, rows: List[Dict], issues: L
         "| Font | Kind | Version | License | Font URL | License URL | Status |",
         "| --- | --- | --- | --- | --- | --- | --- |",
     ]
-    for row in rows:
-        lines.append(
-            f"| `{row['name']}` | `{row['kind']}` | `{row['version']}` | `{row['license']}` | "
-            f"{row['font_url']} | {row['license_url']} | `{row['status']}` |"
-        )
-    lines.append("")
-    if issues:
-        lines.append("## Issues")
-        for issue in issues:
-            lines.append(f"- `{issue['name']}`: {json.dumps(issue, ensure_ascii=True)}")
-    else:
-        lines.append("No license or source integrity issues detected in this pass.")
-    lines.append("")
-    (repo_root / "FONT_LICENSE_AUDIT.md").write_text("\n".join(lines), encoding="utf-8")
+    # Rows and issues are streamed straight to the file rather than joined in memory first.
+    with (repo_root / "FONT_LICENSE_AUDIT.md").open("w", encoding="utf-8") as fh:
+        fh.writelines(f"{line}\n" for line in header)
+        fh.writelines(_MD_ROW.format_map(row) for row in rows)
+        fh.write("\n")
+        if issues:
+            fh.write("## Issues\n")
+            fh.writelines(
+                f"- `{issue['name']}`: {json.dumps(issue, ensure_ascii=True)}\n" for issue in issues
+            )
+        else:
+            fh.write("No license or source integrity issues detected in this pass.\n")
+    return summary
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Audit fullbleed remote font licenses")
     parser.add_argument("--date", required=True, help="Audit date (YYYY-MM-DD)")
     parser.add_argument("--repo-root", default=".", help="Repository root path")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Concurrent asset checks (default: {DEFAULT_JOBS})",
+    )
     args = parser.parse_args()
 
     repo_root = Path(args.repo_root).resolve()
@@ -144,8 +243,11 @@ def main() -> int:
 
     rows: List[Dict] = []
     issues: List[Dict] = []
-    for name, meta in sorted(remote_assets.items(), key=lambda item: item[0]):
-        row = _validate_row(name, meta)
+    ordered = sorted(remote_assets.items(), key=itemgetter(0))
+    # Network-bound checks run concurrently; map() keeps rows in sorted name order.
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        validated = list(pool.map(lambda item: _validate_row(*item), ordered))
+    for row in validated:
         rows.append(row)
         if row["status"] != "PASS":
             issues.append(
@@ -156,17 +258,20 @@ def main() -> int:
                     "font_url_ok": row["font_url_ok"],
                     "license_url_ok": row["license_url_ok"],
                     "license_text_ok": row["license_text_ok"],
+                    "reason": row["reason"],
                 }
             )
 
-    _write_reports(repo_root, args.date, rows, issues)
-    summary = {
-        "audit_date": args.date,
-        "remote_assets_count": len(rows),
-        "pass_count": sum(1 for row in rows if row["status"] == "PASS"),
-        "fail_count": len(issues),
-    }
-    print(json.dumps(summary, ensure_ascii=True))
+    summary = _write_reports(repo_root, args.date, rows, issues)
+    print(
+        json.dumps(
+            {
+                key: summary[key]
+                for key in ("audit_date", "remote_assets_count", "pass_count", "fail_count")
+            },
+            ensure_ascii=True,
+        )
+    )
     return 1 if issues else 0
 
 
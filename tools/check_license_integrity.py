@@ -9,7 +9,7 @@ from __future__ import annotations
 import argparse
 import json
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List
 
 
 SPDX_EXPRESSION = "AGPL-3.0-only OR LicenseRef-Fullbleed-Commercial"
@@ -24,6 +24,15 @@ COPYRIGHT_MARKERS = (
 )
 LICENSING_MARKERS = ("dual-licensed", SPDX_EXPRESSION)
 MOJIBAKE_MARKERS = ("â€”", "â€™", "â€œ", "â€", "\ufffd")
+_LICENSE_FORBIDDEN_LOWER = tuple(m.lower() for m in LICENSE_FORBIDDEN)
+_COPYRIGHT_MARKERS_LOWER = tuple(m.lower() for m in COPYRIGHT_MARKERS)
+_LICENSING_MARKERS_LOWER = tuple(m.lower() for m in LICENSING_MARKERS)
+REQUIRED_FILES = (
+    ("license", "LICENSE"),
+    ("copyright", "COPYRIGHT"),
+    ("licensing_guide", "LICENSING.md"),
+    ("third_party_notice", "THIRD_PARTY_LICENSES.md"),
+)
 
 
 def _read(path: Path) -> str:
@@ -34,81 +43,90 @@ def _fail(code: str, target: str, message: str) -> Dict[str, str]:
     return {"code": code, "target": target, "message": message}
 
 
-def run(repo_root: Path) -> Dict:
-    flags: List[Dict[str, str]] = []
-    files = {
-        "license": repo_root / "LICENSE",
-        "copyright": repo_root / "COPYRIGHT",
-        "licensing_guide": repo_root / "LICENSING.md",
-        "third_party_notice": repo_root / "THIRD_PARTY_LICENSES.md",
-    }
-
-    for key, path in files.items():
-        if not path.exists():
-            flags.append(_fail("LIC_MISSING_NOTICE", str(path), f"Missing required file: {key}"))
-
-    if files["license"].exists():
-        text = _read(files["license"])
-        if LICENSE_HEADER not in text:
-            flags.append(
-                _fail(
-                    "LIC_POLICY_MISMATCH",
-                    str(files["license"]),
-                    f"LICENSE missing sentinel header: {LICENSE_HEADER}",
-                )
+def _check_license(text: str, lowered: str, path: Path, flags: List[Dict[str, str]]) -> None:
+    if LICENSE_HEADER not in text:
+        flags.append(
+            _fail(
+                "LIC_POLICY_MISMATCH",
+                str(path),
+                f"LICENSE missing sentinel header: {LICENSE_HEADER}",
             )
-        bad = [m for m in LICENSE_FORBIDDEN if m.lower() in text.lower()]
-        if bad:
-            flags.append(
-                _fail(
-                    "LIC_POLICY_MISMATCH",
-                    str(files["license"]),
-                    "LICENSE contains disallowed marker(s): " + ", ".join(bad),
-                )
+        )
+    bad = [m for m, low in zip(LICENSE_FORBIDDEN, _LICENSE_FORBIDDEN_LOWER) if low in lowered]
+    if bad:
+        flags.append(
+            _fail(
+                "LIC_POLICY_MISMATCH",
+                str(path),
+                "LICENSE contains disallowed marker(s): " + ", ".join(bad),
             )
+        )
 
-    if files["copyright"].exists():
-        text = _read(files["copyright"])
-        if SPDX_EXPRESSION not in text:
-            flags.append(
-                _fail(
-                    "LIC_POLICY_MISMATCH",
-                    str(files["copyright"]),
-                    "COPYRIGHT missing SPDX expression: " + SPDX_EXPRESSION,
-                )
+
+def _check_copyright(text: str, lowered: str, path: Path, flags: List[Dict[str, str]]) -> None:
+    if SPDX_EXPRESSION not in text:
+        flags.append(
+            _fail(
+                "LIC_POLICY_MISMATCH",
+                str(path),
+                "COPYRIGHT missing SPDX expression: " + SPDX_EXPRESSION,
             )
-        lowered = text.lower()
-        missing = [m for m in COPYRIGHT_MARKERS if m.lower() not in lowered]
-        if missing:
-            flags.append(
-                _fail(
-                    "LIC_POLICY_MISMATCH",
-                    str(files["copyright"]),
-                    "COPYRIGHT missing required marker(s): " + ", ".join(missing),
-                )
+        )
+    missing = [m for m, low in zip(COPYRIGHT_MARKERS, _COPYRIGHT_MARKERS_LOWER) if low not in lowered]
+    if missing:
+        flags.append(
+            _fail(
+                "LIC_POLICY_MISMATCH",
+                str(path),
+                "COPYRIGHT missing required marker(s): " + ", ".join(missing),
             )
+        )
+
 
-    if files["licensing_guide"].exists():
-        text = _read(files["licensing_guide"])
-        lowered = text.lower()
-        missing = [m for m in LICENSING_MARKERS if m.lower() not in lowered]
-        if missing:
-            flags.append(
-                _fail(
-                    "LIC_POLICY_MISMATCH",
-                    str(files["licensing_guide"]),
-                    "LICENSING.md missing required marker(s): " + ", ".join(missing),
-                )
+def _check_licensing_guide(text: str, lowered: str, path: Path, flags: List[Dict[str, str]]) -> None:
+    missing = [m for m, low in zip(LICENSING_MARKERS, _LICENSING_MARKERS_LOWER) if low not in lowered]
+    if missing:
+        flags.append(
+            _fail(
+                "LIC_POLICY_MISMATCH",
+                str(path),
+                "LICENSING.md missing required marker(s): " + ", ".join(missing),
             )
-        mojibake = [m for m in MOJIBAKE_MARKERS if m in text]
-        if mojibake:
-            flags.append(
-                _fail(
-                    "LIC_POLICY_MISMATCH",
-                    str(files["licensing_guide"]),
-                    "LICENSING.md contains encoding artifacts: " + ", ".join(mojibake),
-                )
+        )
+    mojibake = [m for m in MOJIBAKE_MARKERS if m in text]
+    if mojibake:
+        flags.append(
+            _fail(
+                "LIC_POLICY_MISMATCH",
+                str(path),
+                "LICENSING.md contains encoding artifacts: " + ", ".join(mojibake),
             )
+        )
+
+
+_CHECKS: Dict[str, Callable[[str, str, Path, List[Dict[str, str]]], None]] = {
+    "license": _check_license,
+    "copyright": _check_copyright,
+    "licensing_guide": _check_licensing_guide,
+}
+
+
+def run(repo_root: Path) -> Dict:
+    flags: List[Dict[str, str]] = []
+    files = {key: repo_root / name for key, name in REQUIRED_FILES}
+
+    # Read each file once; missing-file flags are reported ahead of content checks.
+    texts: Dict[str, str] = {}
+    for key, path in files.items():
+        try:
+            texts[key] = _read(path)
+        except FileNotFoundError:
+            flags.append(_fail("LIC_MISSING_NOTICE", str(path), f"Missing required file: {key}"))
+
+    for key, check in _CHECKS.items():
+        if key in texts:
+            text = texts[key]
+            check(text, text.lower(), files[key], flags)
 
     return {
         "schema": "fullbleed.license_integrity.v1",
@@ -3,18 +3,63 @@
 from __future__ import annotations
 
 import argparse
+import difflib
+import hashlib
 import json
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional; only used behind --orjson
+    orjson = None
 
 
 STATUS_ORDER = ["not_started", "in_progress", "partial", "implemented", "n/a"]
 STAGE_ORDER = ["parser", "compute", "layout", "paint"]
 PROGRESS_STATUSES = {"partial", "implemented"}
+# Hashed membership for validation; the lists above keep output ordering.
+_STATUS_SET = frozenset(STATUS_ORDER)
+CACHE_SCHEMA = "fullbleed.css_parity_status.cache.v1"
+
+
+def _posix(path: Path) -> str:
+    return path.as_posix()
+
 
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
 
-def _load_json(path: Path) -> Dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+
+def _cache_path(output_path: Path) -> Path:
+    return output_path.with_name(output_path.name + ".cache")
+
+
+def _cache_record(
+    ledger_sha: str, input_path: Path, rendered_sha: str, serializer: str
+) -> Dict[str, Any]:
+    # The generator's own source is part of the key so logic changes invalidate the cache.
+    return {
+        "schema": CACHE_SCHEMA,
+        "ledger_sha": ledger_sha,
+        "source_ledger": _posix(input_path),
+        "generator_sha": _sha256(Path(__file__).read_bytes()),
+        "serializer": serializer,
+        "rendered_sha": rendered_sha,
+    }
+
+
+def _cache_hit(ledger_sha: str, input_path: Path, output_path: Path, serializer: str) -> bool:
+    """True when the output on disk is known to match what the current ledger would render."""
+    try:
+        cached = json.loads(_cache_path(output_path).read_text(encoding="utf-8"))
+        output_sha = _sha256(output_path.read_bytes())
+    except (OSError, ValueError):
+        return False
+    return cached == _cache_record(ledger_sha, input_path, output_sha, serializer)
 
 
 def _percent(numerator: int, denominator: int) -> float:
@@ -23,7 +68,7 @@ def _percent(numerator: int, denominator: int) -> float:
     return round((numerator / denominator) * 100.0, 2)
 
 
-def _validate_ledger(ledger: Dict[str, Any]) -> None:
+def _validate_ledger_header(ledger: Dict[str, Any]) -> List[Dict[str, Any]]:
     schema = ledger.get("schema")
     if schema != "fullbleed.css_parity_ledger.v1":
         raise ValueError(f"Unsupported ledger schema: {schema!r}")
@@ -31,7 +76,26 @@ def _validate_ledger(ledger: Dict[str, Any]) -> None:
     modules = ledger.get("modules")
     if not isinstance(modules, list) or not modules:
         raise ValueError("Ledger must contain a non-empty 'modules' list")
-
+    return modules
+
+
+def _validate_and_rollup(
+    modules: List[Dict[str, Any]],
+) -> Tuple[Dict[str, int], Dict[str, Dict[str, Any]]]:
+    """Validate each module and tally module/stage statuses in the same pass."""
+    module_counts = dict.fromkeys(STATUS_ORDER, 0)
+    rollup: Dict[str, Dict[str, Any]] = {
+        stage: {
+            "counts": dict.fromkeys(STATUS_ORDER, 0),
+            "applicable_total": 0,
+            "progress_total": 0,
+            "implemented_total": 0,
+        }
+        for stage in STAGE_ORDER
+    }
+    # Modules outer, stages inner: each module's stage_status is looked up once.
+    stage_entries = [(stage, rollup[stage]) for stage in STAGE_ORDER]
+    progress_statuses = PROGRESS_STATUSES
     seen_ids = set()
     for module in modules:
         module_id = module.get("id")
@@ -42,55 +106,43 @@ def _validate_ledger(ledger: Dict[str, Any]) -> None:
         seen_ids.add(module_id)
 
         status = module.get("status")
-        if status not in STATUS_ORDER:
+        if not isinstance(status, str) or status not in _STATUS_SET:
             raise ValueError(f"Invalid status {status!r} for module {module_id}")
+        module_counts[status] += 1
 
         stage_status = module.get("stage_status")
         if not isinstance(stage_status, dict):
             raise ValueError(f"Module {module_id} is missing stage_status")
-        for stage in STAGE_ORDER:
+        for stage, entry in stage_entries:
             stage_value = stage_status.get(stage)
-            if stage_value not in STATUS_ORDER:
+            if not isinstance(stage_value, str) or stage_value not in _STATUS_SET:
                 raise ValueError(
                     f"Invalid stage status {stage_value!r} for {module_id}.{stage}"
                 )
-
-
-def _stage_rollup(modules: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
-    rollup: Dict[str, Dict[str, Any]] = {}
-    for stage in STAGE_ORDER:
-        counts = {status: 0 for status in STATUS_ORDER}
-        applicable_total = 0
-        progress_total = 0
-        implemented_total = 0
-        for module in modules:
-            status = module["stage_status"][stage]
-            counts[status] += 1
-            if status == "n/a":
+            entry["counts"][stage_value] += 1
+            if stage_value == "n/a":
                 continue
-            applicable_total += 1
-            if status in PROGRESS_STATUSES:
-                progress_total += 1
-            if status == "implemented":
-                implemented_total += 1
-
-        rollup[stage] = {
-            "counts": counts,
-            "applicable_total": applicable_total,
-            "progress_total": progress_total,
-            "implemented_total": implemented_total,
-            "progress_percent": _percent(progress_total, applicable_total),
-            "implemented_percent": _percent(implemented_total, applicable_total),
-        }
-    return rollup
+            entry["applicable_total"] += 1
+            if stage_value in progress_statuses:
+                entry["progress_total"] += 1
+            if stage_value == "implemented":
+                entry["implemented_total"] += 1
 
+    for entry in rollup.values():
+        entry["progress_percent"] = _percent(entry["progress_total"], entry["applicable_total"])
+        entry["implemented_percent"] = _percent(entry["implemented_total"], entry["applicable_total"])
+    return module_counts, rollup
 
-def _build_status_payload(ledger: Dict[str, Any], source_path: Path) -> Dict[str, Any]:
-    modules = sorted(ledger["modules"], key=lambda item: item.get("priority", 10**9))
 
-    module_counts = {status: 0 for status in STATUS_ORDER}
-    for module in modules:
-        module_counts[module["status"]] += 1
+def _build_status_payload(ledger: Dict[str, Any], source_path: Path) -> Dict[str, Any]:
+    # Validate in ledger order so the first reported error is unchanged; tallies are order-free.
+    module_counts, stage_rollup = _validate_and_rollup(_validate_ledger_header(ledger))
+    modules = list(ledger["modules"])
+    priorities = [module.get("priority", 10**9) for module in modules]
+    # Ledgers are normally maintained in priority order; only sort when one is out of place.
+    if any(later < earlier for earlier, later in zip(priorities, priorities[1:])):
+        order = sorted(range(len(modules)), key=priorities.__getitem__)
+        modules = [modules[index] for index in order]
 
     total_modules = len(modules)
     module_progress = (
@@ -100,11 +152,9 @@ def _build_status_payload(ledger: Dict[str, Any], source_path: Path) -> Dict[str
     )
     module_implemented = module_counts["implemented"]
 
-    stage_rollup = _stage_rollup(modules)
-
     return {
         "schema": "fullbleed.css_parity_status.v1",
-        "source_ledger": str(source_path).replace("\\", "/"),
+        "source_ledger": _posix(source_path),
         "summary": {
             "total_modules": total_modules,
             "module_counts": module_counts,
@@ -118,15 +168,100 @@ def _build_status_payload(ledger: Dict[str, Any], source_path: Path) -> Dict[str
     }
 
 
-def _canonical_json(payload: Dict[str, Any]) -> str:
-    return json.dumps(payload, ensure_ascii=True, indent=2, sort_keys=True) + "\n"
+_CANONICAL_ENCODER = json.JSONEncoder(ensure_ascii=True, indent=2, sort_keys=True)
+
+
+def _write_canonical_json(payload: Dict[str, Any], fp: Any) -> None:
+    for chunk in _CANONICAL_ENCODER.iterencode(payload):
+        fp.write(chunk)
+    fp.write("\n")
+
+
+def _new_check_digest() -> Any:
+    return hashlib.blake2b(digest_size=16)
+
 
+def _canonical_digest(payload: Dict[str, Any]) -> bytes:
+    """Digest of the canonical rendering, computed without materializing the full string."""
+    digest = _new_check_digest()
+    for chunk in _CANONICAL_ENCODER.iterencode(payload):
+        digest.update(chunk.encode("utf-8"))
+    digest.update(b"\n")
+    return digest.digest()
 
-def run(input_path: Path, output_path: Path, check: bool, emit_json: bool) -> int:
-    ledger = _load_json(input_path)
-    _validate_ledger(ledger)
-    payload = _build_status_payload(ledger, input_path)
-    rendered = _canonical_json(payload)
+
+def _orjson_bytes(payload: Dict[str, Any]) -> bytes:
+    # orjson emits raw UTF-8 rather than \u escapes, so this is not byte-identical to the
+    # stdlib rendering for non-ASCII ledgers; callers opt in with --orjson.
+    return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2) + b"\n"
+
+
+def _text_digest(path: Path) -> bytes:
+    # Text mode so platform newlines hash the same as the canonical "\n" rendering.
+    digest = _new_check_digest()
+    with path.open("r", encoding="utf-8") as fh:
+        for chunk in iter(lambda: fh.read(1 << 16), ""):
+            digest.update(chunk.encode("utf-8"))
+    return digest.digest()
+
+
+def _print_drift(output_path: Path, rendered: str) -> None:
+    # Only reached on mismatch, so materializing both documents here is acceptable.
+    current = output_path.read_text(encoding="utf-8")
+    sys.stdout.writelines(
+        difflib.unified_diff(
+            current.splitlines(keepends=True),
+            rendered.splitlines(keepends=True),
+            fromfile=str(output_path),
+            tofile=f"{output_path} (expected)",
+        )
+    )
+
+
+# run() may be called repeatedly from a long-lived build process; key on the input's stat
+# identity so an edited ledger is re-read. Cached payloads are shared and must not be mutated.
+@lru_cache(maxsize=8)
+def _read_ledger(path: str, mtime_ns: int, size: int) -> Tuple[bytes, str]:
+    raw = Path(path).read_bytes()
+    return raw, _sha256(raw)
+
+
+@lru_cache(maxsize=8)
+def _status_payload(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    raw, _ = _read_ledger(path, mtime_ns, size)
+    return _build_status_payload(json.loads(raw.decode("utf-8")), Path(path))
+
+
+def _report_check(ok: bool, output_path: Path, emit_json: bool) -> int:
+    report = {
+        "schema": "fullbleed.css_parity_status.check.v1",
+        "ok": ok,
+        "output": _posix(output_path),
+    }
+    if emit_json:
+        print(json.dumps(report, ensure_ascii=True))
+    else:
+        print(f"ok={ok} output={output_path}")
+    return 0 if ok else 1
+
+
+def run(
+    input_path: Path,
+    output_path: Path,
+    check: bool,
+    emit_json: bool,
+    use_orjson: bool = False,
+) -> int:
+    if use_orjson and orjson is None:
+        raise RuntimeError("--orjson requires the 'orjson' package")
+    serializer = "orjson" if use_orjson else "json"
+    stat = input_path.stat()
+    ledger_key = (str(input_path), stat.st_mtime_ns, stat.st_size)
+    _, ledger_sha = _read_ledger(*ledger_key)
+    if check and _cache_hit(ledger_sha, input_path, output_path, serializer):
+        return _report_check(True, output_path, emit_json)
+
+    payload = _status_payload(*ledger_key)
 
     if check:
         if not output_path.exists():
@@ -134,32 +269,48 @@ def run(input_path: Path, output_path: Path, check: bool, emit_json: bool) -> in
                 "schema": "fullbleed.css_parity_status.check.v1",
                 "ok": False,
                 "reason": "missing_output",
-                "output": str(output_path),
+                "output": _posix(output_path),
             }
             if emit_json:
                 print(json.dumps(report, ensure_ascii=True))
             else:
                 print(f"missing parity status output: {output_path}")
             return 1
-        current = output_path.read_text(encoding="utf-8")
-        ok = current == rendered
-        report = {
-            "schema": "fullbleed.css_parity_status.check.v1",
-            "ok": ok,
-            "output": str(output_path),
-        }
-        if emit_json:
-            print(json.dumps(report, ensure_ascii=True))
+        if use_orjson:
+            ok = output_path.read_bytes() == _orjson_bytes(payload)
         else:
-            print(f"ok={ok} output={output_path}")
-        return 0 if ok else 1
+            ok = _text_digest(output_path) == _canonical_digest(payload)
+        status = _report_check(ok, output_path, emit_json)
+        if not ok and not emit_json:
+            if use_orjson:
+                rendered = _orjson_bytes(payload).decode("utf-8")
+            else:
+                rendered = "".join(_CANONICAL_ENCODER.iterencode(payload)) + "\n"
+            _print_drift(output_path, rendered)
+        return status
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(rendered, encoding="utf-8")
+    # Stream into a sibling temp file and swap it in, so readers never see a partial write.
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    try:
+        if use_orjson:
+            tmp_path.write_bytes(_orjson_bytes(payload))
+        else:
+            with tmp_path.open("w", encoding="utf-8") as fh:
+                _write_canonical_json(payload, fh)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    # Hash the bytes as written (newline translation included) so --check can trust the cache.
+    record = _cache_record(ledger_sha, input_path, _sha256(output_path.read_bytes()), serializer)
+    _cache_path(output_path).write_text(
+        json.dumps(record, ensure_ascii=True, sort_keys=True), encoding="utf-8"
+    )
     report = {
         "schema": "fullbleed.css_parity_status.generate.v1",
         "ok": True,
-        "output": str(output_path),
+        "output": _posix(output_path),
         "modules": payload["summary"]["total_modules"],
     }
     if emit_json:
@@ -193,9 +344,22 @@ def main() -> int:
         action="store_true",
         help="Emit command result as JSON.",
     )
+    parser.add_argument(
+        "--orjson",
+        action="store_true",
+        help="Serialize with orjson (faster; not byte-identical to the default output for non-ASCII data).",
+    )
     args = parser.parse_args()
-
-    return run(Path(args.input), Path(args.out), args.check, args.json)
+    if args.orjson and orjson is None:
+        parser.error("--orjson requires the 'orjson' package")
+
+    return run(
+        Path(args.input),
+        Path(args.out),
+        args.check,
+        args.json,
+        use_orjson=args.orjson,
+    )
 
 
 if __name__ == "__main__":